@@ -24,6 +24,14 @@ Space Complexity:
 Prerequisites: Array must be sorted in ascending order
 """
 
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
 def binary_search(arr, target):
     """
     Searches for a target element in a sorted array using binary search.
@@ -227,6 +235,9 @@ def binary_search_range(arr, target):
     """
     Find the range [first_index, last_index] of target in a sorted array.
     
+    Both boundaries come from one shared descent (see binary_search_value_range),
+    so the probes above the first split are not repeated.
+    
     Args:
         arr (list): Sorted list that may contain duplicates
         target: Element to search for
@@ -234,12 +245,47 @@ def binary_search_range(arr, target):
     Returns:
         tuple: (first_index, last_index) or (-1, -1) if not found
     """
-    first = binary_search_leftmost(arr, target)
-    if first == -1:
+    start, stop = _fused_bounds(arr, target, target, True)
+    if start == stop:
         return (-1, -1)
     
-    last = binary_search_rightmost(arr, target)
-    return (first, last)
+    return (start, stop - 1)
+
+
+def _fused_bounds(arr, lo, hi, hi_inclusive=False):
+    """
+    Find both boundaries of the value range [lo, hi) (or [lo, hi] when
+    hi_inclusive) in a single descent.
+    
+    While the middle element lies outside the range, both boundaries are on the
+    same side of it and one comparison narrows the search for both. At the first
+    element inside the range the boundaries diverge, and each is finished with a
+    bisection of its own half of the remaining window.
+    
+    Returns:
+        tuple: (start, stop) positions, with arr[start:stop] the matching elements
+    """
+    left = 0
+    right = len(arr)
+    
+    while left < right:
+        mid = left + (right - left) // 2
+        value = arr[mid]
+        
+        if value < lo:
+            left = mid + 1
+        elif (hi < value) if hi_inclusive else not (value < hi):
+            right = mid
+        else:
+            # lo <= value < hi: split into two independent bound searches
+            start = bisect_left(arr, lo, left, mid)
+            if hi_inclusive:
+                stop = bisect_right(arr, hi, mid + 1, right)
+            else:
+                stop = bisect_left(arr, hi, mid + 1, right)
+            return (start, stop)
+    
+    return (left, left)
 
 
 def binary_search_insertion_point(arr, target):
@@ -273,6 +319,9 @@ def binary_search_2d_matrix(matrix, target):
     - Each row is sorted from left to right
     - First element of each row is greater than last element of previous row
     
+    Matrices that are only sorted along rows and down columns do not satisfy this;
+    use staircase_search (searching/matrix_search.py) for those.
+    
     Args:
         matrix (list of lists): 2D matrix
         target: Element to search for
@@ -307,6 +356,251 @@ def binary_search_2d_matrix(matrix, target):
     return (-1, -1)
 
 
+def binary_search_many(arr, targets, mode="exact"):
+    """
+    Locate many targets in the same sorted array in one call.
+    
+    Small batches (fewer than len(arr) / 8 queries) are answered by one bisect
+    per query: sorting the queries would cost more than it saves. Larger batches
+    are sorted once and answered in ascending order, so each search starts at the
+    previous answer and gallops forward from the expected gap between queries to
+    bracket the next one before bisecting. When there are at least as many
+    queries as elements, a single linear merge of the two sorted sequences is
+    used instead. If either input is a NumPy array the whole batch is answered by
+    the vectorized np.searchsorted.
+    
+    Args:
+        arr (list): Sorted list of comparable elements
+        targets (list): Values to look up (any order, duplicates allowed)
+        mode (str): What to report for each target:
+            "exact"     - an index of the target, or -1 (the leftmost occurrence)
+            "leftmost"  - index of the first occurrence, or -1
+            "rightmost" - index of the last occurrence, or -1
+            "insertion" - insertion point, as binary_search_insertion_point
+            
+    Returns:
+        list: One result per target, in the original query order
+              (a NumPy array when the NumPy path is used)
+        
+    Examples:
+        >>> binary_search_many([1, 3, 3, 5, 7], [5, 3, 4])
+        [3, 1, -1]
+        
+        >>> binary_search_many([1, 3, 3, 5, 7], [5, 3, 4], mode="rightmost")
+        [3, 2, -1]
+        
+        >>> binary_search_many([1, 3, 3, 5, 7], [8, 0, 4], mode="insertion")
+        [5, 0, 3]
+    """
+    if mode not in ("exact", "leftmost", "rightmost", "insertion"):
+        raise ValueError(f"Unknown mode: {mode!r}")
+    
+    if np is not None and (isinstance(arr, np.ndarray) or isinstance(targets, np.ndarray)):
+        return _binary_search_many_numpy(arr, targets, mode)
+    
+    n = len(arr)
+    m = len(targets)
+    results = [-1] * m
+    if m == 0:
+        return results
+    
+    find_right = mode == "rightmost"
+    search = bisect_right if find_right else bisect_left
+    
+    if m * 8 < n:
+        # Sparse queries: independent bisections in query order
+        for q in range(m):
+            results[q] = search(arr, targets[q])
+    elif m < n:
+        # Moderate batches: each search starts where the previous one ended and
+        # gallops forward to bracket the answer before bisecting
+        order = sorted(range(m), key=targets.__getitem__)
+        stride = 2 * n // m
+        lo = 0
+        for q in order:
+            target = targets[q]
+            step = stride
+            hi = lo + step
+            if find_right:
+                while hi < n and not target < arr[hi]:
+                    lo = hi + 1
+                    step += step
+                    hi = lo + step
+            else:
+                while hi < n and arr[hi] < target:
+                    lo = hi + 1
+                    step += step
+                    hi = lo + step
+            lo = search(arr, target, lo, hi if hi < n else n)
+            results[q] = lo
+    else:
+        # Dense queries: merge the sorted queries with the array in one pass
+        order = sorted(range(m), key=targets.__getitem__)
+        i = 0
+        for q in order:
+            target = targets[q]
+            if find_right:
+                while i < n and not target < arr[i]:
+                    i += 1
+            else:
+                while i < n and arr[i] < target:
+                    i += 1
+            results[q] = i
+    
+    # Convert boundary positions into the requested answers
+    if mode in ("exact", "leftmost"):
+        for q in range(m):
+            pos = results[q]
+            if pos == n or arr[pos] != targets[q]:
+                results[q] = -1
+    elif find_right:
+        for q in range(m):
+            pos = results[q] - 1
+            results[q] = pos if pos >= 0 and arr[pos] == targets[q] else -1
+    
+    return results
+
+
+def _binary_search_many_numpy(arr, targets, mode):
+    """Vectorized binary_search_many using np.searchsorted."""
+    arr = np.asarray(arr)
+    targets = np.asarray(targets)
+    n = len(arr)
+    
+    if mode == "rightmost":
+        positions = np.searchsorted(arr, targets, side="right") - 1
+    else:
+        positions = np.searchsorted(arr, targets, side="left")
+    
+    if mode == "insertion":
+        return positions
+    
+    if n == 0:
+        return np.full(targets.shape, -1, dtype=np.intp)
+    
+    clipped = np.clip(positions, 0, n - 1)
+    found = (positions >= 0) & (positions < n) & (arr[clipped] == targets)
+    return np.where(found, positions, -1)
+
+
+def binary_search_value_range(arr, lo, hi):
+    """
+    Find the positions of all elements with lo <= value < hi in a sorted array.
+    
+    Args:
+        arr (list): Sorted list of comparable elements
+        lo: Inclusive lower value bound
+        hi: Exclusive upper value bound
+        
+    Returns:
+        tuple: (start, stop) such that arr[start:stop] are exactly the matches
+        
+    Examples:
+        >>> binary_search_value_range([1, 3, 3, 5, 7, 9], 3, 7)
+        (1, 4)
+        
+        >>> binary_search_value_range([1, 3, 3, 5, 7, 9], 4, 5)
+        (3, 3)
+    """
+    return _fused_bounds(arr, lo, hi)
+
+
+def binary_search_range_count(arr, lo, hi):
+    """
+    Count the elements with lo <= value < hi in a sorted array.
+    
+    Args:
+        arr (list): Sorted list of comparable elements
+        lo: Inclusive lower value bound
+        hi: Exclusive upper value bound
+        
+    Returns:
+        int: Number of matching elements
+        
+    Examples:
+        >>> binary_search_range_count([1, 3, 3, 5, 7, 9], 3, 7)
+        3
+    """
+    start, stop = _fused_bounds(arr, lo, hi)
+    return stop - start
+
+
+def binary_search_range_view(arr, lo, hi):
+    """
+    Zero-copy view of the elements with lo <= value < hi.
+    
+    Args:
+        arr: Sorted array; buffer-backed arrays (array.array, bytes, NumPy) give
+             a memoryview, any other sequence gives index bounds
+        lo: Inclusive lower value bound
+        hi: Exclusive upper value bound
+        
+    Returns:
+        memoryview over the matching elements, or a (start, stop) index pair
+        when arr does not expose a buffer (e.g. a list)
+        
+    Examples:
+        >>> from array import array
+        >>> binary_search_range_view(array('i', [1, 3, 3, 5, 7]), 3, 6).tolist()
+        [3, 3, 5]
+        
+        >>> binary_search_range_view([1, 3, 3, 5, 7], 3, 6)
+        (1, 4)
+    """
+    start, stop = _fused_bounds(arr, lo, hi)
+    try:
+        view = memoryview(arr)
+    except TypeError:
+        return (start, stop)
+    return view[start:stop]
+
+
+def binary_search_range_counts(arr, ranges):
+    """
+    Count the elements of a sorted array in many [lo, hi) ranges at once.
+    
+    All range boundaries are located together with binary_search_many, so
+    overlapping or nearby ranges share the sweep over the array.
+    
+    Args:
+        arr (list): Sorted list of comparable elements
+        ranges (list): (lo, hi) pairs, each a half-open value range
+        
+    Returns:
+        list: Count of elements in each range, in the input order
+        
+    Examples:
+        >>> binary_search_range_counts([1, 3, 3, 5, 7, 9], [(3, 7), (0, 2), (8, 8)])
+        [3, 1, 0]
+    """
+    if not ranges:
+        return []
+    
+    bounds = [lo for lo, _ in ranges] + [hi for _, hi in ranges]
+    positions = binary_search_many(arr, bounds, mode="insertion")
+    m = len(ranges)
+    return [max(0, positions[m + i] - positions[i]) for i in range(m)]
+
+
+def binary_search_histogram(arr, edges):
+    """
+    Histogram of a sorted array over consecutive bins [edges[i], edges[i+1]).
+    
+    Args:
+        arr (list): Sorted list of comparable elements
+        edges (list): Ascending bin edges
+        
+    Returns:
+        list: len(edges) - 1 bin counts
+        
+    Examples:
+        >>> binary_search_histogram([1, 2, 2, 3, 5, 8, 13], [0, 2, 4, 8, 16])
+        [1, 3, 1, 2]
+    """
+    positions = binary_search_many(arr, edges, mode="insertion")
+    return [positions[i + 1] - positions[i] for i in range(len(edges) - 1)]
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     # Test cases for basic binary search
@@ -369,13 +663,13 @@ if __name__ == "__main__":
     
     # Test 2D matrix search
     print("\n=== 2D Matrix Binary Search ===")
+    # Each row starts after the previous row ends
     matrix = [
-        [1,  4,  7,  11],
-        [2,  5,  8,  12],
-        [3,  6,  9,  16],
-        [10, 13, 14, 17]
+        [1,  3,  5,  7],
+        [10, 11, 16, 20],
+        [23, 30, 34, 60]
     ]
-    target = 5
+    target = 16
     print("Matrix:")
     for row in matrix:
         print(f"  {row}")
@@ -390,4 +684,44 @@ if __name__ == "__main__":
     print("\n=== Verbose Example ===")
     sample_array = [2, 5, 8, 12, 16, 23, 38, 56, 67, 78]
     target = 23
-    binary_search_verbose(sample_array, target)
\ No newline at end of file
+    binary_search_verbose(sample_array, target)
+    
+    # Batch lookups against one sorted array
+    print("\n=== Batch Binary Search ===")
+    test_array = [1, 2, 2, 2, 3, 4, 4, 5, 6, 6, 6, 7]
+    targets = [6, 2, 9, 1, 4]
+    print(f"Array:   {test_array}")
+    print(f"Targets: {targets}")
+    for mode in ("exact", "leftmost", "rightmost", "insertion"):
+        print(f"  {mode:9}: {binary_search_many(test_array, targets, mode)}")
+    
+    import random
+    import time
+    big_array = sorted(random.sample(range(10_000_000), 1_000_000))
+    print(f"\nInsertion points in {len(big_array):,} elements (bisect_left is the baseline):")
+    for batch in (20_000, 60_000, 250_000, 1_000_000):
+        queries = [random.randrange(10_000_000) for _ in range(batch)]
+        start = time.perf_counter()
+        baseline = [bisect_left(big_array, q) for q in queries]
+        bisect_time = time.perf_counter() - start
+        start = time.perf_counter()
+        one_by_one = [binary_search_insertion_point(big_array, q) for q in queries]
+        loop_time = time.perf_counter() - start
+        start = time.perf_counter()
+        batched = binary_search_many(big_array, queries, mode="insertion")
+        batch_time = time.perf_counter() - start
+        print(f"  {batch:>9,} queries: bisect_left {bisect_time:.3f}s, "
+              f"binary_search_insertion_point {loop_time:.3f}s, "
+              f"binary_search_many {batch_time:.3f}s "
+              f"(match: {baseline == one_by_one == batched})")
+    
+    # Value-range queries with fused boundary search
+    print("\n=== Range Count and Slice Queries ===")
+    from array import array
+    test_array = array('i', [1, 2, 2, 2, 3, 4, 4, 5, 6, 6, 6, 7])
+    print(f"Array: {test_array.tolist()}")
+    print(f"Positions of values in [2, 5): {binary_search_value_range(test_array, 2, 5)}")
+    print(f"Count of values in [2, 5):     {binary_search_range_count(test_array, 2, 5)}")
+    print(f"View of values in [4, 7):      {binary_search_range_view(test_array, 4, 7).tolist()}")
+    print(f"Counts for [(1, 3), (6, 9)]:   {binary_search_range_counts(test_array, [(1, 3), (6, 9)])}")
+    print(f"Histogram with edges 0,3,6,9:  {binary_search_histogram(test_array, [0, 3, 6, 9])}")
\ No newline at end of file
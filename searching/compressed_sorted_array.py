@@ -0,0 +1,307 @@
+"""
+Compressed Sorted Array (Delta + Varint Blocks With a Skip Index)
+
+A Python list of ints costs about 36 bytes per element (an 8-byte pointer plus a
+28-byte int object), and even array('q') needs 8. Sorted IDs are highly
+compressible: consecutive values differ by small gaps. CompressedSortedArray splits
+the sorted values into blocks of block_size elements and stores:
+- heads: the first value of every block, in an array('q')
+- offsets: where each block's encoded gaps start, in an array('q')
+- data: one bytearray with the gaps between consecutive values of each block,
+  written as varints (7 bits per byte, high bit = "more bytes follow")
+
+The heads double as a skip index: a binary search over them finds the only block
+that can hold a value, and only that block is decoded. Blocks whose gaps all fit
+in one byte, which is common for dense IDs, are decoded in C with
+itertools.accumulate.
+
+Queries mirror the binary_search functions:
+- search / contains: like binary_search_leftmost
+- rank: like binary_search_insertion_point (number of elements < value)
+- iter_range(lo, hi) / count_range(lo, hi): half-open value ranges
+
+Time Complexity:
+- Build: O(n)
+- search / rank / contains: O(log(n / B) + B) for block size B
+- Range iteration: O(log(n / B) + B + k) for k reported values
+
+Space Complexity: about 1-3 bytes per element for dense IDs, plus 16 bytes per block
+
+Prerequisites: Integers sorted in ascending order (64-bit signed range)
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+
+class CompressedSortedArray:
+    """
+    Read-only sorted integer array stored as delta-encoded varint blocks.
+
+    Examples:
+        >>> ids = CompressedSortedArray([3, 7, 7, 10, 200, 1000], block_size=4)
+        >>> ids.search(7), ids.search(8), ids.rank(10), 1000 in ids
+        (1, -1, 3, True)
+
+        >>> list(ids.iter_range(5, 300))
+        [7, 7, 10, 200]
+    """
+
+    def __init__(self, sorted_values, block_size=128):
+        """
+        Args:
+            sorted_values: Integers in ascending order (any iterable)
+            block_size (int): Elements per block; larger blocks compress slightly
+                              better but make every lookup decode more
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self._heads = array('q')
+        self._offsets = array('q')
+        self._data = bytearray()
+        self._n = 0
+
+        data = self._data
+        previous = None
+        in_block = 0
+        for value in sorted_values:
+            if in_block == 0:
+                if previous is not None and value < previous:
+                    raise ValueError("values must be sorted in ascending order")
+                self._heads.append(value)
+                self._offsets.append(len(data))
+            else:
+                gap = value - previous
+                if gap < 0:
+                    raise ValueError("values must be sorted in ascending order")
+                while gap >= 0x80:
+                    data.append((gap & 0x7F) | 0x80)
+                    gap >>= 7
+                data.append(gap)
+            previous = value
+            self._n += 1
+            in_block = (in_block + 1) % block_size
+
+        self._offsets.append(len(data))  # end sentinel
+
+    def __len__(self):
+        return self._n
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def __iter__(self):
+        for block in range(len(self._heads)):
+            yield from self._decode(block)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("index out of range")
+        block, i = divmod(index, self.block_size)
+        return self._decode(block)[i]
+
+    def _block_length(self, block):
+        return min(self.block_size, self._n - block * self.block_size)
+
+    def _decode(self, block):
+        """Values of one block as a list."""
+        head = self._heads[block]
+        start = self._offsets[block]
+        stop = self._offsets[block + 1]
+        data = self._data
+
+        if stop - start == self._block_length(block) - 1:
+            # Every gap fits in one byte: the prefix sums are the values
+            return list(accumulate(data[start:stop], initial=head))
+
+        values = [head]
+        value = head
+        position = start
+        while position < stop:
+            byte = data[position]
+            position += 1
+            gap = byte & 0x7F
+            shift = 7
+            while byte & 0x80:
+                byte = data[position]
+                position += 1
+                gap |= (byte & 0x7F) << shift
+                shift += 7
+            value += gap
+            values.append(value)
+        return values
+
+    def _locate(self, value):
+        """
+        Position of the first element >= value.
+
+        Returns:
+            tuple: (rank, values) where values is the decoded block containing
+                   that position, or None when it is the head of a block (or the end)
+        """
+        block = bisect_left(self._heads, value)
+        if block == 0:
+            return 0, None
+        # Every element of blocks >= block is >= value; the answer is inside block - 1
+        # unless all of that block is smaller
+        values = self._decode(block - 1)
+        i = bisect_left(values, value)
+        rank = (block - 1) * self.block_size + i
+        return rank, (values if i < len(values) else None)
+
+    def rank(self, value):
+        """
+        Number of elements smaller than value (binary_search_insertion_point).
+
+        Args:
+            value (int): Value to locate
+
+        Returns:
+            int: Insertion position of value
+        """
+        return self._locate(value)[0]
+
+    def search(self, value):
+        """
+        Position of the first occurrence of value (binary_search_leftmost).
+
+        Args:
+            value (int): Value to search for
+
+        Returns:
+            int: Index of the first match, -1 if not found
+        """
+        rank, values = self._locate(value)
+        if rank >= self._n:
+            return -1
+        if values is not None:
+            found = values[rank % self.block_size]
+        else:
+            found = self._heads[rank // self.block_size]
+        return rank if found == value else -1
+
+    def contains(self, value):
+        """
+        Whether value is present.
+
+        Args:
+            value (int): Value to search for
+
+        Returns:
+            bool: True if found
+        """
+        return self.search(value) != -1
+
+    def count_range(self, lo, hi):
+        """
+        Number of elements in the half-open interval [lo, hi).
+
+        Args:
+            lo (int): Inclusive lower bound
+            hi (int): Exclusive upper bound
+
+        Returns:
+            int: Count of matching elements
+        """
+        if hi <= lo:
+            return 0
+        return self.rank(hi) - self.rank(lo)
+
+    def iter_range(self, lo, hi):
+        """
+        Iterate over the elements in the half-open interval [lo, hi).
+
+        Args:
+            lo (int): Inclusive lower bound
+            hi (int): Exclusive upper bound
+
+        Yields:
+            int: Matching elements in ascending order
+        """
+        rank = self.rank(lo)
+        block, i = divmod(rank, self.block_size)
+        for block in range(block, len(self._heads)):
+            values = self._decode(block)
+            for value in values[i:]:
+                if value >= hi:
+                    return
+                yield value
+            i = 0
+
+    def memory_usage(self):
+        """
+        Bytes used by the compressed representation.
+
+        Returns:
+            int: Size of the heads, offsets and encoded data buffers
+        """
+        return (sys.getsizeof(self._heads) + sys.getsizeof(self._offsets)
+                + sys.getsizeof(self._data))
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import os
+    import random
+    import time
+
+    # Make the sibling searching modules importable when this file is run directly
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from searching.binary_search import binary_search_leftmost
+
+    print("=== CompressedSortedArray Basics ===\n")
+    values = [3, 7, 7, 10, 200, 1000, 1001, 70_000, 70_001]
+    ids = CompressedSortedArray(values, block_size=4)
+    print(f"Values:            {values}")
+    print(f"search(7):         {ids.search(7)}")
+    print(f"search(1001):      {ids.search(1001)}")
+    print(f"search(8):         {ids.search(8)}")
+    print(f"rank(1000):        {ids.rank(1000)}")
+    print(f"iter_range(5, 2000): {list(ids.iter_range(5, 2000))}")
+
+    print("\n=== Randomised Check Against binary_search_leftmost ===")
+    rng = random.Random(0)
+    ok = True
+    for _ in range(300):
+        data = sorted(rng.randint(-50, 50) * rng.choice((1, 1, 1000))
+                      for _ in range(rng.randint(0, 60)))
+        compressed = CompressedSortedArray(data, block_size=rng.randint(1, 9))
+        ok &= list(compressed) == data
+        for target in range(-60, 61):
+            target *= rng.choice((1, 1000))
+            ok &= compressed.search(target) == binary_search_leftmost(data, target)
+            ok &= compressed.rank(target) == bisect_left(data, target)
+        lo, hi = sorted(rng.randint(-60_000, 60_000) for _ in range(2))
+        ok &= list(compressed.iter_range(lo, hi)) == [v for v in data if lo <= v < hi]
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
+
+    print("\n=== Memory and Speed: 2,000,000 sorted 64-bit IDs ===")
+    base = rng.randrange(10**12)
+    id_list = list(accumulate((rng.randint(1, 60) for _ in range(2_000_000)), initial=base))
+    list_bytes = sys.getsizeof(id_list) + sum(sys.getsizeof(v) for v in id_list)
+    typed_bytes = sys.getsizeof(array('q', id_list))
+
+    start = time.perf_counter()
+    compressed = CompressedSortedArray(id_list)
+    build_time = time.perf_counter() - start
+    size = compressed.memory_usage()
+
+    print(f"  list of ints:          {list_bytes / len(id_list):6.2f} bytes/element")
+    print(f"  array('q'):            {typed_bytes / len(id_list):6.2f} bytes/element")
+    print(f"  CompressedSortedArray: {size / len(id_list):6.2f} bytes/element "
+          f"(built in {build_time:.2f}s)")
+
+    queries = [rng.choice(id_list) + rng.randint(0, 1) for _ in range(20_000)]
+    start = time.perf_counter()
+    expected = [binary_search_leftmost(id_list, q) for q in queries]
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [compressed.search(q) for q in queries]
+    compressed_time = time.perf_counter() - start
+    print(f"  20,000 lookups: binary_search_leftmost on list {list_time:.3f}s, "
+          f"compressed {compressed_time:.3f}s (same results: {results == expected})")
@@ -0,0 +1,210 @@
+"""
+Exponential (Galloping) Search Algorithm Implementation
+
+Exponential Search finds a target in a sorted sequence by first finding a range that
+must contain it, probing positions 1, 2, 4, 8, ... until it passes the target, and
+then binary searching inside that last range. It costs O(log i) where i is the
+position of the target, so it beats plain binary search when the target is near the
+front, and it works even when the length of the data is unknown or unbounded.
+
+Variants provided:
+- exponential_search: sorted list, optionally galloping from a start index
+- exponential_search_unbounded: data reachable only through a probe(i) function
+  that raises IndexError past the end (unknown length)
+- exponential_search_iter: sorted iterators/streams, which are consumed in chunks
+  of doubling size so that only O(log i) comparisons run in Python
+
+Time Complexity:
+- Best Case: O(1)
+- Average/Worst Case: O(log i) where i is the index of the target
+
+Space Complexity: O(1) (O(chunk) for the iterator variant)
+
+Prerequisites: Data must be sorted in ascending order
+"""
+
+from bisect import bisect_left
+from itertools import islice
+
+
+def exponential_search(arr, target, start=0):
+    """
+    Searches for target in a sorted array by galloping forward from start.
+
+    Args:
+        arr (list): Sorted list of comparable elements
+        target: Element to search for
+        start (int): Index to start galloping from (defaults to 0)
+
+    Returns:
+        int: Index of the first occurrence of target at or after start, -1 if not found
+
+    Examples:
+        >>> exponential_search([2, 3, 4, 10, 40, 50, 60, 70], 10)
+        3
+
+        >>> exponential_search([2, 3, 4, 10, 40], 5)
+        -1
+    """
+    n = len(arr)
+    if start >= n:
+        return -1
+
+    # Find a range (start + bound // 2, start + bound] that contains the target
+    bound = 1
+    while start + bound < n and arr[start + bound] < target:
+        bound *= 2
+
+    left = start + bound // 2 if bound > 1 else start
+    right = min(start + bound, n - 1)
+
+    # Leftmost binary search inside the range
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+
+    return left if arr[left] == target else -1
+
+
+def exponential_search_unbounded(probe, target):
+    """
+    Exponential search over sorted data of unknown length.
+
+    Args:
+        probe (function): probe(i) returns the i-th element and raises IndexError
+                          when i is past the end
+        target: Element to search for
+
+    Returns:
+        int: Index of the first occurrence of target, -1 if not found
+
+    Examples:
+        >>> exponential_search_unbounded(lambda i: i * 3, 27)
+        9
+    """
+    def value_at(i):
+        """Element at i, or None past the end (treated as +infinity)."""
+        try:
+            return probe(i)
+        except IndexError:
+            return None
+
+    first = value_at(0)
+    if first is None:
+        return -1
+    if not first < target:
+        return 0 if first == target else -1
+
+    # Gallop until we pass the target or fall off the end
+    bound = 1
+    while True:
+        value = value_at(bound)
+        if value is None or not value < target:
+            break
+        bound *= 2
+
+    # Lower bound lies in (bound // 2, bound]
+    left = bound // 2 + 1
+    right = bound
+    while left < right:
+        mid = left + (right - left) // 2
+        value = value_at(mid)
+        if value is not None and value < target:
+            left = mid + 1
+        else:
+            right = mid
+
+    value = value_at(left)
+    return left if value is not None and value == target else -1
+
+
+def exponential_search_iter(iterable, target, max_chunk=1 << 16):
+    """
+    Exponential search over a sorted iterator or stream.
+
+    Elements are pulled in chunks of doubling size (capped at max_chunk) with
+    itertools.islice. Only the last element of each chunk is compared in Python;
+    the chunk that passes the target is then bisected. Iteration stops as soon as
+    the target's position is known, so the rest of the stream is never read.
+
+    Args:
+        iterable: Sorted iterable of comparable elements
+        target: Element to search for
+        max_chunk (int): Largest chunk held in memory at once
+
+    Returns:
+        int: Index of the first occurrence of target, -1 if not found
+
+    Examples:
+        >>> exponential_search_iter(iter(range(0, 10**12, 5)), 35)
+        7
+    """
+    iterator = iter(iterable)
+    offset = 0
+    size = 1
+
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return -1
+
+        if not chunk[-1] < target:
+            i = bisect_left(chunk, target)
+            return offset + i if chunk[i] == target else -1
+
+        offset += len(chunk)
+        size = min(size * 2, max_chunk)
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+
+    test_cases = [
+        ([2, 3, 4, 10, 40, 50, 60, 70], 10, 3),
+        ([2, 3, 4, 10, 40], 5, -1),
+        ([1, 2, 3, 4, 5], 1, 0),
+        ([1, 2, 3, 4, 5], 5, 4),
+        ([1, 1, 1, 2, 2], 2, 3),
+        ([], 5, -1),
+        ([42], 42, 0),
+    ]
+
+    print("=== Exponential Search Test Cases ===\n")
+
+    for i, (arr, target, expected) in enumerate(test_cases):
+        result = exponential_search(arr, target)
+        print(f"Test Case {i + 1}: target {target} in {arr}")
+        print(f"Result: {result} (Expected: {expected})")
+        print(f"Status: {'✓ PASS' if result == expected else '✗ FAIL'}")
+        print()
+
+    print("=== Unknown Length (probe function) ===")
+    data = list(range(0, 2000, 7))
+
+    def probe(i):
+        if i >= len(data):
+            raise IndexError(i)
+        return data[i]
+
+    for target in (0, 700, 701, 1995):
+        print(f"  target {target:4d}: {exponential_search_unbounded(probe, target)}")
+
+    print("\n=== Sorted Stream ===")
+    stream = (n * n for n in range(10**9))  # effectively unbounded
+    print(f"  Index of 144 in squares: {exponential_search_iter(stream, 144)}")
+
+    print("\n=== Randomised Check Against list.index ===")
+    rng = random.Random(0)
+    ok = True
+    for _ in range(500):
+        arr = sorted(rng.randint(0, 50) for _ in range(rng.randint(0, 40)))
+        target = rng.randint(-1, 51)
+        expected = arr.index(target) if target in arr else -1
+        ok &= exponential_search(arr, target) == expected
+        ok &= exponential_search_iter(iter(arr), target) == expected
+        ok &= exponential_search_unbounded(lambda i: arr[i], target) == expected
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
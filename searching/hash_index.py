@@ -0,0 +1,295 @@
+"""
+Hash Index for Repeated Object Lookups
+
+linear_search_objects(objects, key_func, target) scans the whole list and calls
+key_func on every object, every time it is called. When the same list is searched
+over and over, it pays to evaluate key_func once per object and remember where each
+key occurs. HashIndex builds a dictionary from key to the ascending list of
+positions holding that key in one pass; after that, find_first, find_all and
+contains are dictionary lookups.
+
+The index works on the caller's list and keeps the mapping consistent through its
+mutation methods:
+- append: O(1), the new position is added to its key's list
+- update: O(d) for d duplicates of the old and new keys
+- delete: O(1) for the last element; deleting from the middle shifts every later
+  position, so the index only marks itself stale and rebuilds on the next query
+  (from the cached keys, without calling key_func again)
+Code that mutates the list directly can call invalidate() to force a rebuild.
+
+Time Complexity:
+- Build / rebuild: O(n)
+- find_first / contains: O(1) average
+- find_all: O(k) for k matches
+
+Space Complexity: O(n) - one cached key and one position entry per object
+"""
+
+import sys
+from bisect import bisect_left, insort
+
+
+class HashIndex:
+    """
+    Objects indexed by a key function for O(1) lookups.
+
+    Examples:
+        >>> people = [("Alice", 25), ("Bob", 30), ("Diana", 25)]
+        >>> index = HashIndex(people, key_func=lambda p: p[1])
+        >>> index.find_first(25), index.find_all(25), index.contains(40)
+        (0, [0, 2], False)
+
+        >>> index.append(("Eve", 30))
+        >>> index.find_all(30)
+        [1, 3]
+    """
+
+    def __init__(self, objects, key_func):
+        """
+        Args:
+            objects (list): Objects to index (the list is used directly, not copied)
+            key_func (function): Extracts the lookup key from an object
+        """
+        self._objects = objects if isinstance(objects, list) else list(objects)
+        self._key_func = key_func
+        self._keys = [key_func(obj) for obj in self._objects]
+        self._positions = {}
+        self._stale = True
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recreate the key -> positions map from the cached keys."""
+        positions = {}
+        for i, key in enumerate(self._keys):
+            bucket = positions.get(key)
+            if bucket is None:
+                positions[key] = [i]
+            else:
+                bucket.append(i)
+        self._positions = positions
+        self._stale = False
+
+    def _map(self):
+        if self._stale:
+            self._rebuild()
+        return self._positions
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __getitem__(self, index):
+        return self._objects[index]
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    @property
+    def objects(self):
+        """The indexed list of objects."""
+        return self._objects
+
+    def find_first(self, key):
+        """
+        Position of the first object with the given key (like linear_search_objects).
+
+        Args:
+            key: Key value to search for
+
+        Returns:
+            int: Index of the first matching object, -1 if not found
+        """
+        bucket = self._map().get(key)
+        return bucket[0] if bucket else -1
+
+    def find_all(self, key):
+        """
+        Positions of all objects with the given key.
+
+        Args:
+            key: Key value to search for
+
+        Returns:
+            list: Indices of matching objects in increasing order
+        """
+        bucket = self._map().get(key)
+        return list(bucket) if bucket else []
+
+    def contains(self, key):
+        """
+        Whether any object has the given key.
+
+        Args:
+            key: Key value to search for
+
+        Returns:
+            bool: True if at least one object matches
+        """
+        return key in self._map()
+
+    def get(self, key, default=None):
+        """
+        First object with the given key.
+
+        Args:
+            key: Key value to search for
+            default: Value returned when no object has the key
+
+        Returns:
+            The first matching object, or default
+        """
+        i = self.find_first(key)
+        return self._objects[i] if i != -1 else default
+
+    def append(self, obj):
+        """
+        Append an object and index it.
+
+        Args:
+            obj: Object to add at the end
+        """
+        key = self._key_func(obj)
+        position = len(self._objects)
+        self._objects.append(obj)
+        self._keys.append(key)
+        if not self._stale:
+            self._positions.setdefault(key, []).append(position)
+
+    def update(self, index, obj):
+        """
+        Replace the object at a position and move it to its new key.
+
+        Args:
+            index (int): Position of the object to replace
+            obj: Replacement object
+        """
+        if index < 0:
+            index += len(self._objects)
+        if not 0 <= index < len(self._objects):
+            raise IndexError("index out of range")
+
+        key = self._key_func(obj)
+        old_key = self._keys[index]
+        self._objects[index] = obj
+        self._keys[index] = key
+
+        if self._stale or key == old_key:
+            return
+        self._discard_position(old_key, index)
+        insort(self._positions.setdefault(key, []), index)
+
+    def delete(self, index):
+        """
+        Remove the object at a position.
+
+        Deleting the last object is O(1). Any other position shifts the indices
+        after it, so the map is marked stale and rebuilt on the next query.
+
+        Args:
+            index (int): Position of the object to remove
+        """
+        if index < 0:
+            index += len(self._objects)
+        if not 0 <= index < len(self._objects):
+            raise IndexError("index out of range")
+
+        key = self._keys[index]
+        del self._objects[index]
+        del self._keys[index]
+
+        if self._stale:
+            return
+        if index == len(self._objects):
+            self._discard_position(key, index)
+        else:
+            self._stale = True
+
+    def invalidate(self):
+        """
+        Re-read every key after the object list was changed from outside.
+
+        Call this after mutating the list (or the key fields of its objects)
+        without going through append, update or delete.
+        """
+        self._keys = [self._key_func(obj) for obj in self._objects]
+        self._stale = True
+
+    def _discard_position(self, key, index):
+        bucket = self._positions[key]
+        del bucket[bisect_left(bucket, index)]
+        if not bucket:
+            del self._positions[key]
+
+    def memory_footprint(self):
+        """
+        Approximate memory used by the index itself, in bytes.
+
+        Counts the hash table, the position lists and their integers plus the
+        cached key list; the objects and key values are shared with the caller
+        and not included.
+
+        Returns:
+            int: Size in bytes
+        """
+        positions = self._map()
+        total = sys.getsizeof(positions) + sys.getsizeof(self._keys)
+        for bucket in positions.values():
+            total += sys.getsizeof(bucket)
+            total += sum(sys.getsizeof(i) for i in bucket if i > 256)  # small ints are shared
+        return total
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import os
+    import random
+    import time
+
+    # Make the sibling searching modules importable when this file is run directly
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from searching.linear_search import linear_search_objects
+
+    class Person:
+        def __init__(self, name, city):
+            self.name = name
+            self.city = city
+
+        def __repr__(self):
+            return f"{self.name}({self.city})"
+
+    print("=== HashIndex Over Objects ===\n")
+    people = [Person("Alice", "Paris"), Person("Bob", "Oslo"),
+              Person("Charlie", "Paris"), Person("Diana", "Rome")]
+    by_city = HashIndex(people, key_func=lambda p: p.city)
+    print(f"People:                {by_city.objects}")
+    print(f"find_first('Paris'):   {by_city.find_first('Paris')}")
+    print(f"find_all('Paris'):     {by_city.find_all('Paris')}")
+    print(f"contains('Berlin'):    {by_city.contains('Berlin')}")
+
+    by_city.append(Person("Eve", "Berlin"))
+    by_city.update(0, Person("Alice", "Oslo"))
+    by_city.delete(1)
+    print(f"After append/update/delete: {by_city.objects}")
+    print(f"find_all('Oslo'):      {by_city.find_all('Oslo')}")
+    print(f"find_first('Berlin'):  {by_city.find_first('Berlin')}")
+
+    print("\n=== Benchmark: 1,000 lookups over 100,000 objects ===")
+    rng = random.Random(0)
+    records = [Person(f"p{i}", f"city{rng.randrange(20_000)}") for i in range(100_000)]
+    queries = [f"city{rng.randrange(25_000)}" for _ in range(1_000)]
+
+    start = time.perf_counter()
+    expected = [linear_search_objects(records, lambda p: p.city, q) for q in queries]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = HashIndex(records, key_func=lambda p: p.city)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [index.find_first(q) for q in queries]
+    lookup_time = time.perf_counter() - start
+
+    print(f"  linear_search_objects: {scan_time:.3f} seconds")
+    print(f"  HashIndex build:       {build_time:.3f} seconds")
+    print(f"  HashIndex.find_first:  {lookup_time:.5f} seconds")
+    print(f"  Same results: {results == expected}")
+    print(f"  Index memory: {index.memory_footprint() / 1e6:.1f} MB")
@@ -0,0 +1,238 @@
+"""
+Interpolation Search Algorithm Implementation
+
+Interpolation Search improves on binary search for sorted numeric data whose values
+are spread roughly evenly, such as timestamps or sequential IDs. Instead of always
+probing the middle of the interval, it estimates where the target should be from the
+values at the two ends, the way one opens a phone book near "S" to find "Smith".
+
+On uniformly distributed data the estimate is so good that the interval shrinks
+doubly exponentially, giving O(log log n) probes. On skewed data the estimate can be
+poor and plain interpolation degrades to O(n), so this implementation switches to
+ordinary binary search as soon as an interpolation step fails to at least halve
+the interval. Each interpolation step (the estimated position plus, when needed, a
+guard probe about sqrt(width) beyond it) reads at most two elements and must halve
+the interval to continue, so the worst case stays at about 2 log2(n) reads, O(log n).
+
+Key characteristics:
+- Requires sorted numeric data (values must support subtraction and division)
+- Very fast on evenly spaced keys
+- Safeguarded: falls back to binary search the first time interpolation does not pay off
+- Each element is read at most once per search (endpoint values are carried forward)
+
+Time Complexity:
+- Best Case: O(1)
+- Average Case: O(log log n) for uniformly distributed keys
+- Worst Case: O(log n) with the binary search fallback
+
+Space Complexity: O(1)
+
+Prerequisites: Array must be sorted in ascending order
+"""
+
+from math import isqrt
+
+
+def interpolation_search(arr, target):
+    """
+    Searches for target in a sorted numeric array using safeguarded interpolation search.
+
+    Args:
+        arr (list): Sorted list of numbers
+        target: Number to search for
+
+    Returns:
+        int: Index of the target element if found, -1 otherwise
+
+    Examples:
+        >>> interpolation_search([10, 20, 30, 40, 50, 60, 70], 50)
+        4
+
+        >>> interpolation_search([1, 2, 4, 8, 16, 32, 64, 128], 3)
+        -1
+
+        >>> interpolation_search([], 5)
+        -1
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+
+    low_val = arr[0]
+    if target <= low_val:
+        return 0 if target == low_val else -1
+    if n == 1:
+        return -1
+    high_val = arr[n - 1]
+    if target >= high_val:
+        return n - 1 if target == high_val else -1
+
+    # Invariant: arr[low] = low_val < target < high_val = arr[high]; the values at
+    # both ends are carried forward so no element is read twice
+    low = 0
+    high = n - 1
+
+    while high - low > 1:
+        # Estimate the target's position from the values at both ends
+        pos = low + int((target - low_val) * (high - low) / (high_val - low_val))
+        if pos <= low:
+            pos = low + 1
+        elif pos >= high:
+            pos = high - 1
+
+        value = arr[pos]
+        if value == target:
+            return pos
+
+        # The estimate is usually within about sqrt(width) of the target, so when
+        # the probe alone did not halve the interval, a second probe that far
+        # beyond it closes the other end
+        width = high - low
+        step = isqrt(width)
+        if value < target:
+            low, low_val = pos, value
+            guard = pos + step
+            if guard < high and 2 * (high - low) > width:
+                value = arr[guard]
+                if value == target:
+                    return guard
+                if value < target:
+                    low, low_val = guard, value
+                else:
+                    high, high_val = guard, value
+        else:
+            high, high_val = pos, value
+            guard = pos - step
+            if guard > low and 2 * (high - low) > width:
+                value = arr[guard]
+                if value == target:
+                    return guard
+                if value > target:
+                    high, high_val = guard, value
+                else:
+                    low, low_val = guard, value
+
+        if 2 * (high - low) > width:
+            break  # the probe did not halve the interval: stop interpolating
+
+    # Safeguard: finish the remaining interval with plain binary search
+    while high - low > 1:
+        mid = (low + high) // 2
+        value = arr[mid]
+        if value == target:
+            return mid
+        elif value < target:
+            low = mid
+        else:
+            high = mid
+
+    return -1
+
+
+def interpolation_search_verbose(arr, target):
+    """
+    Interpolation search with step-by-step output for educational purposes.
+
+    Args:
+        arr (list): Sorted list of numbers
+        target: Number to search for
+
+    Returns:
+        int: Index of target element if found, -1 otherwise
+    """
+    print(f"Starting Interpolation Search for target: {target}")
+    print(f"Array: {arr}")
+    print("-" * 60)
+
+    left = 0
+    right = len(arr) - 1
+    step = 1
+
+    while left <= right and arr[left] <= target <= arr[right]:
+        if arr[right] == arr[left]:
+            break
+
+        pos = left + int((target - arr[left]) * (right - left) / (arr[right] - arr[left]))
+        print(f"Step {step}: range [{left}, {right}], values [{arr[left]}, {arr[right]}]")
+        print(f"  Estimated position: {pos} (arr[{pos}] = {arr[pos]})")
+
+        if arr[pos] == target:
+            print(f"  ✓ Found! Target {target} found at index {pos}")
+            return pos
+        elif arr[pos] < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+        step += 1
+
+    if left <= right and arr[left] == target:
+        print(f"  ✓ Found! Target {target} found at index {left}")
+        return left
+
+    print(f"Target {target} not found in the array")
+    return -1
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+
+    test_cases = [
+        ([10, 20, 30, 40, 50, 60, 70], 50, 4),
+        ([1, 2, 4, 8, 16, 32, 64, 128], 3, -1),
+        ([1, 2, 4, 8, 16, 32, 64, 128], 64, 6),
+        ([5, 5, 5, 5], 5, 0),
+        ([], 5, -1),
+        ([42], 42, 0),
+        ([1.5, 2.5, 3.5], 2.5, 1),
+    ]
+
+    print("=== Interpolation Search Test Cases ===\n")
+
+    for i, (arr, target, expected) in enumerate(test_cases):
+        result = interpolation_search(arr, target)
+        print(f"Test Case {i + 1}: target {target} in {arr}")
+        print(f"Result: {result} (Expected: {expected})")
+        print(f"Status: {'✓ PASS' if result == expected else '✗ FAIL'}")
+        print()
+
+    class ProbeCounter(list):
+        """List that counts element reads, to compare probe counts."""
+        probes = 0
+
+        def __getitem__(self, index):
+            ProbeCounter.probes += 1
+            return list.__getitem__(self, index)
+
+    def average_probes(search, arr, queries):
+        ProbeCounter.probes = 0
+        for q in queries:
+            search(arr, q)
+        return ProbeCounter.probes / len(queries)
+
+    def binary_search(arr, target):
+        left, right = 0, len(arr) - 1
+        while left <= right:
+            mid = left + (right - left) // 2
+            value = arr[mid]
+            if value == target:
+                return mid
+            elif value > target:
+                right = mid - 1
+            else:
+                left = mid + 1
+        return -1
+
+    print("=== Average Element Reads per Search ===")
+    rng = random.Random(0)
+    for size in (1_000, 100_000, 1_000_000):
+        uniform = ProbeCounter(sorted(rng.sample(range(size * 10), size)))
+        skewed = ProbeCounter(sorted(int(rng.random() ** 6 * size * 10) for _ in range(size)))
+        queries = [rng.randrange(size * 10) for _ in range(2_000)]
+        print(f"  n={size:>9,}: uniform - binary {average_probes(binary_search, uniform, queries):5.1f}, "
+              f"interpolation {average_probes(interpolation_search, uniform, queries):5.1f} | "
+              f"skewed - binary {average_probes(binary_search, skewed, queries):5.1f}, "
+              f"interpolation {average_probes(interpolation_search, skewed, queries):5.1f}")
+
+    print("\n=== Verbose Example ===")
+    interpolation_search_verbose([10, 20, 30, 40, 50, 60, 70, 80, 90], 70)
@@ -0,0 +1,294 @@
+"""
+Learned Index (Piecewise-Linear Model With a Guaranteed Error Bound)
+
+Binary search treats a sorted array as a black box and spends log2(n) probes on
+every lookup. A learned index instead fits a model of where each key lives.
+For a static sorted array the "position as a function of key" curve (the CDF of
+the keys) is usually close to straight over long stretches, so it can be
+approximated by a few line segments.
+
+The model is built in one pass with the shrinking-cone algorithm (as in
+FITing-Tree / PGM-index): a segment starts at a key and keeps the cone of slopes
+that predict every key added so far to within epsilon positions. Each new key
+narrows the cone; when the cone becomes empty, a new segment starts. The fit uses
+the first occurrence of every distinct key, so duplicates cost nothing.
+
+A lookup then:
+1. bisects the (small) array of segment start keys to pick the segment
+2. evaluates that segment's line to predict a position
+3. binary searches only the window [pos - epsilon, pos + epsilon], clamped to the
+   segment, and verifies the answer; if the check fails (keys between indexed
+   points, long runs of duplicates, floating-point rounding) it falls back to a
+   bisection over the segment, so results are always exact
+
+Queries mirror the binary_search functions: search (leftmost), search_rightmost,
+insertion_point and half-open search_range(lo, hi).
+
+Time Complexity:
+- Build: O(n)
+- Lookup: O(log s + log epsilon) for s segments
+
+Space Complexity: O(s) - three numbers per segment; the data itself is not copied
+
+Prerequisites: Static array sorted in ascending order with numeric keys
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+if __name__ == "__main__":
+    # Let `python searching/learned_index.py` find the searching package
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from searching.static_search import compact_array
+
+
+class LearnedIndex:
+    """
+    Piecewise-linear position model over a static sorted array.
+
+    Examples:
+        >>> keys = [2, 4, 4, 6, 8, 10, 100, 200, 300]
+        >>> index = LearnedIndex(keys, epsilon=1)
+        >>> index.search(4), index.search(5), index.search_range(4, 100)
+        (1, -1, (1, 6))
+    """
+
+    def __init__(self, sorted_arr, epsilon=32):
+        """
+        Args:
+            sorted_arr: Sorted sequence of numbers (list, array.array, ...);
+                        kept by reference, so it must not change afterwards
+            epsilon (int): Maximum distance between a predicted and a true position
+        """
+        if epsilon < 0:
+            raise ValueError("epsilon must be non-negative")
+        self._arr = sorted_arr
+        self.epsilon = epsilon
+
+        seg_keys = []
+        seg_positions = []
+        seg_slopes = []
+
+        start_key = start_pos = None
+        slope_lo = slope_hi = None
+        previous = None
+
+        for position, key in enumerate(sorted_arr):
+            if previous is not None:
+                if key < previous:
+                    raise ValueError("array must be sorted in ascending order")
+                if key == previous:
+                    continue  # model only the first occurrence of each key
+            previous = key
+
+            if start_key is not None:
+                dx = key - start_key
+                dy = position - start_pos
+                lo = (dy - epsilon) / dx
+                hi = (dy + epsilon) / dx
+                new_lo = lo if slope_lo is None or lo > slope_lo else slope_lo
+                new_hi = hi if slope_hi is None or hi < slope_hi else slope_hi
+                if new_lo <= new_hi:
+                    slope_lo, slope_hi = new_lo, new_hi
+                    continue
+                seg_slopes.append(_cone_slope(slope_lo, slope_hi))
+
+            # Start a new segment at this key; the cone is unbounded until a second key
+            start_key, start_pos = key, position
+            slope_lo = slope_hi = None
+            seg_keys.append(key)
+            seg_positions.append(position)
+
+        if start_key is not None:
+            seg_slopes.append(_cone_slope(slope_lo, slope_hi))
+
+        self._seg_keys = compact_array(seg_keys)
+        self._seg_positions = array('q', seg_positions)
+        self._seg_slopes = array('d', seg_slopes)
+        self._n = len(sorted_arr)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def segments(self):
+        """Number of linear segments in the model."""
+        return len(self._seg_positions)
+
+    def predict(self, key):
+        """
+        Model estimate of the position of key.
+
+        Args:
+            key: Key to locate
+
+        Returns:
+            int: Predicted position (within epsilon of the first occurrence for
+                 keys present in the array)
+        """
+        s = bisect_right(self._seg_keys, key) - 1
+        if s < 0:
+            return 0
+        return int(self._seg_positions[s] + self._seg_slopes[s] * (key - self._seg_keys[s]))
+
+    def _bound(self, key, strict):
+        """Same as bisect_left (bisect_right when strict) over the whole array."""
+        arr = self._arr
+        n = self._n
+        s = bisect_right(self._seg_keys, key) - 1
+        if s < 0:
+            return 0
+
+        # The answer lies between this segment's start and the next segment's start
+        seg_lo = self._seg_positions[s]
+        seg_hi = self._seg_positions[s + 1] if s + 1 < len(self._seg_positions) else n
+
+        predicted = int(self._seg_positions[s] + self._seg_slopes[s] * (key - self._seg_keys[s]))
+        lo = max(seg_lo, predicted - self.epsilon - 1)
+        hi = min(seg_hi, predicted + self.epsilon + 2)
+
+        if lo < hi:
+            if strict:
+                i = bisect_right(arr, key, lo, hi)
+                valid = (i == 0 or arr[i - 1] <= key) and (i == n or key < arr[i])
+            else:
+                i = bisect_left(arr, key, lo, hi)
+                valid = (i == 0 or arr[i - 1] < key) and (i == n or not arr[i] < key)
+            if valid:
+                return i
+
+        # Outside the error window: bisect the whole segment instead
+        search = bisect_right if strict else bisect_left
+        return search(arr, key, seg_lo, seg_hi)
+
+    def insertion_point(self, key):
+        """
+        Same as binary_search_insertion_point.
+
+        Args:
+            key: Key to locate
+
+        Returns:
+            int: Index of the first element >= key
+        """
+        return self._bound(key, False)
+
+    def search(self, key):
+        """
+        Same as binary_search_leftmost.
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            int: Index of the first occurrence of key, -1 if not found
+        """
+        i = self._bound(key, False)
+        return i if i < self._n and self._arr[i] == key else -1
+
+    def search_rightmost(self, key):
+        """
+        Same as binary_search_rightmost.
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            int: Index of the last occurrence of key, -1 if not found
+        """
+        i = self._bound(key, True) - 1
+        return i if i >= 0 and self._arr[i] == key else -1
+
+    def search_range(self, lo, hi):
+        """
+        Positions of the keys in the half-open interval [lo, hi).
+
+        Args:
+            lo: Inclusive lower key bound
+            hi: Exclusive upper key bound
+
+        Returns:
+            tuple: (start, stop) such that arr[start:stop] holds the matching keys
+        """
+        start = self._bound(lo, False)
+        stop = self._bound(hi, False) if hi > lo else start
+        return (start, stop)
+
+    def memory_usage(self):
+        """
+        Bytes used by the model (the indexed array itself is not counted).
+
+        Returns:
+            int: Size of the segment key, position and slope arrays
+        """
+        return (sys.getsizeof(self._seg_keys) + sys.getsizeof(self._seg_positions)
+                + sys.getsizeof(self._seg_slopes))
+
+
+def _cone_slope(slope_lo, slope_hi):
+    """Slope in the middle of the feasible cone (0 for a single-key segment)."""
+    if slope_lo is None:
+        return 0.0
+    return (slope_lo + slope_hi) / 2
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.binary_search import binary_search_leftmost
+
+    print("=== Learned Index Basics ===\n")
+    keys = [2, 4, 4, 6, 8, 10, 100, 200, 300, 301, 302, 303]
+    index = LearnedIndex(keys, epsilon=1)
+    print(f"Keys:      {keys}")
+    print(f"Segments:  {index.segments}")
+    for key in (4, 5, 100, 303, 1):
+        print(f"  search({key}) = {index.search(key)} (predicted {index.predict(key)})")
+    print(f"  search_range(4, 100) = {index.search_range(4, 100)}")
+
+    print("\n=== Randomised Check Against binary_search_leftmost / bisect ===")
+    rng = random.Random(0)
+    ok = True
+    for _ in range(300):
+        data = sorted(rng.choice((rng.randint(0, 100), rng.randint(0, 10**6)))
+                      for _ in range(rng.randint(0, 80)))
+        model = LearnedIndex(data, epsilon=rng.randint(0, 4))
+        probes = data + [rng.randint(-5, 10**6 + 5) for _ in range(40)]
+        for key in probes:
+            ok &= model.search(key) == binary_search_leftmost(data, key)
+            ok &= model.insertion_point(key) == bisect_left(data, key)
+            ok &= model.search_rightmost(key) == (bisect_right(data, key) - 1
+                                                  if key in data else -1)
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
+
+    print("\n=== Benchmark: 200,000 lookups over 5,000,000 keys ===")
+    n = 5_000_000
+    data = array('q', sorted(rng.randrange(10**12) for _ in range(n)))
+    queries = [data[rng.randrange(n)] for _ in range(200_000)]
+
+    for epsilon in (16, 64, 256):
+        start = time.perf_counter()
+        model = LearnedIndex(data, epsilon=epsilon)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        results = [model.search(q) for q in queries]
+        lookup_time = time.perf_counter() - start
+        print(f"  epsilon={epsilon:<4} {model.segments:>7,} segments, "
+              f"{model.memory_usage() / 1024:8.1f} KiB model, built in {build_time:.2f}s, "
+              f"lookups {lookup_time:.3f}s")
+
+    start = time.perf_counter()
+    expected = [binary_search_leftmost(data, q) for q in queries]
+    binary_time = time.perf_counter() - start
+    start = time.perf_counter()
+    bisected = [bisect_left(data, q) for q in queries]
+    bisect_time = time.perf_counter() - start
+    print(f"  binary_search_leftmost:  {binary_time:.3f}s")
+    print(f"  bisect_left:             {bisect_time:.3f}s")
+    print(f"  Data itself: {sys.getsizeof(data) / 1024 / 1024:.1f} MiB; "
+          f"same results: {results == expected == bisected}")
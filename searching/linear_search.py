@@ -25,6 +25,16 @@ Use cases:
 - One-time searches where preprocessing cost isn't justified
 """
 
+import re
+from array import array
+from itertools import islice, zip_longest
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
 def linear_search(arr, target):
     """
     Searches for a target element in an array using linear search.
@@ -84,6 +94,212 @@ def linear_search_all_indices(arr, target):
     return indices
 
 
+def linear_search_many(arr, targets, all_indices=False, as_dict=False):
+    """
+    Searches for many targets in one pass over the array.
+    
+    Calling linear_search once per target costs O(n * m) for m targets. Here the
+    targets go into a set and the array is scanned once, recording the position(s)
+    of every element that is one of them: O(n + m). When only first positions are
+    wanted the scan stops as soon as every target has been seen.
+    
+    Args:
+        arr: Iterable of elements to search in
+        targets: Elements to search for (must be hashable)
+        all_indices (bool): Record every position instead of only the first
+        as_dict (bool): Return a dict keyed by target instead of a list
+    
+    Returns:
+        list or dict: For each target, its first index (-1 if not found) or, with
+                      all_indices, the list of its indices; in the targets' order,
+                      or as {target: result} when as_dict is set
+    
+    Examples:
+        >>> linear_search_many([5, 3, 8, 3, 1], [3, 7, 1])
+        [1, -1, 4]
+        
+        >>> linear_search_many([5, 3, 8, 3, 1], [3, 7], all_indices=True)
+        [[1, 3], []]
+        
+        >>> linear_search_many([5, 3, 8, 3, 1], [8, 7], as_dict=True)
+        {8: 2, 7: -1}
+    """
+    targets = list(targets)
+    
+    if all_indices:
+        found = {target: [] for target in targets}
+        for i, element in enumerate(arr):
+            hits = found.get(element)
+            if hits is not None:
+                hits.append(i)
+        if as_dict:
+            return found
+        return [list(found[target]) for target in targets]
+    
+    pending = set(targets)
+    found = {}
+    if pending:
+        for i, element in enumerate(arr):
+            if element in pending:
+                pending.discard(element)
+                found[element] = i
+                if not pending:
+                    break  # every target located: the rest of arr is never read
+    
+    if as_dict:
+        return {target: found.get(target, -1) for target in targets}
+    return [found.get(target, -1) for target in targets]
+
+
+def linear_search_iter(iterable, target, limit=None):
+    """
+    Lazily yields the indices where target occurs in any iterable.
+    
+    Unlike linear_search_all_indices, nothing needs to be indexable and no list of
+    results is built: elements are pulled one at a time (lines of an open file,
+    rows of a generator, ...) and iteration stops after limit matches, so the
+    rest of the input is never read.
+    
+    Args:
+        iterable: Any iterable of elements
+        target: Element to search for
+        limit (int): Stop after this many matches (None for no limit)
+    
+    Yields:
+        int: Indices of matching elements in increasing order
+    
+    Examples:
+        >>> list(linear_search_iter(iter([1, 3, 2, 3, 5, 3]), 3))
+        [1, 3, 5]
+        
+        >>> list(linear_search_iter(iter([1, 3, 2, 3, 5, 3]), 3, limit=2))
+        [1, 3]
+    """
+    if limit is not None and limit <= 0:
+        return
+    
+    found = 0
+    for i, element in enumerate(iterable):
+        if element == target:
+            yield i
+            found += 1
+            if found == limit:
+                return
+
+
+def linear_search_condition_iter(iterable, condition_func, limit=None):
+    """
+    Lazily yields the indices of elements that satisfy a condition.
+    
+    Args:
+        iterable: Any iterable of elements
+        condition_func (function): Function that returns True for the desired elements
+        limit (int): Stop after this many matches (None for no limit)
+    
+    Yields:
+        int: Indices of matching elements in increasing order
+    
+    Examples:
+        >>> lines = iter(["ok", "ERROR disk", "ok", "ERROR net"])
+        >>> list(linear_search_condition_iter(lines, lambda s: s.startswith("ERROR")))
+        [1, 3]
+    """
+    if limit is not None and limit <= 0:
+        return
+    
+    found = 0
+    for i, element in enumerate(iterable):
+        if condition_func(element):
+            yield i
+            found += 1
+            if found == limit:
+                return
+
+
+def linear_search_chunks_iter(chunks, target, limit=None):
+    """
+    Lazily yields the indices of target across a stream of chunks.
+    
+    Meant for chunked readers such as iter(lambda: f.read(1 << 20), b"") or
+    batches of rows. Indices are global (counted across chunks). Each chunk is
+    scanned in C where its type allows: bytes and bytearray chunks with repeated
+    bytes.find calls, array.array and memoryview chunks with linear_search_fast
+    on zero-copy slices, lists and tuples with their index method. Reading stops
+    as soon as limit matches have been produced.
+    
+    Args:
+        chunks: Iterable of sequences (bytes, bytearray, array.array, lists, ...)
+        target: Element to search for
+        limit (int): Stop after this many matches (None for no limit)
+    
+    Yields:
+        int: Indices of matching elements in increasing order
+    
+    Examples:
+        >>> list(linear_search_chunks_iter([b"ab\\n", b"c\\nd\\n"], ord("\\n")))
+        [2, 4, 6]
+    """
+    if limit is not None and limit <= 0:
+        return
+    
+    found = 0
+    offset = 0
+    for chunk in chunks:
+        for i in _chunk_matches(chunk, target):
+            yield offset + i
+            found += 1
+            if found == limit:
+                return
+        offset += len(chunk)
+
+
+def _chunk_matches(chunk, target):
+    """Yield the positions of target within one chunk, in increasing order."""
+    if np is not None and isinstance(chunk, np.ndarray):
+        for i in np.flatnonzero(chunk == target):
+            yield int(i)
+        return
+    
+    if isinstance(chunk, (list, tuple)):
+        position = 0
+        while True:
+            try:
+                position = chunk.index(target, position)
+            except ValueError:
+                return
+            yield position
+            position += 1
+    
+    if isinstance(chunk, (bytes, bytearray)):
+        # Same target rules as linear_search_fast: only integral values 0..255 can match
+        if not isinstance(target, int) and not (isinstance(target, float) and target.is_integer()):
+            return
+        target = int(target)
+        if not 0 <= target < 256:
+            return
+        position = chunk.find(target)
+        while position != -1:
+            yield position
+            position = chunk.find(target, position + 1)
+        return
+    
+    if isinstance(chunk, (array, memoryview)):
+        # Zero-copy slices of the chunk, each searched in C
+        view = memoryview(chunk)
+        position = 0
+        while position < len(view):
+            i = linear_search_fast(view[position:], target)
+            if i == -1:
+                return
+            yield position + i
+            position += i + 1
+        return
+    
+    for i, element in enumerate(chunk):
+        if element == target:
+            yield i
+
+
 def linear_search_verbose(arr, target):
     """
     Linear search with detailed step-by-step output for educational purposes.
@@ -211,6 +427,340 @@ def linear_search_min_max(arr):
     return min_val, max_val, min_idx, max_idx
 
 
+def linear_search_min_max_pairwise(arr):
+    """
+    Find the minimum and maximum with about 3n/2 comparisons instead of 2n - 2.
+    
+    Elements are taken in pairs. The two are compared with each other first, then
+    only the smaller one is compared against the running minimum and only the
+    larger one against the running maximum: 3 comparisons per 2 elements.
+    
+    Tie-breaking (same as linear_search_min_max): when the minimum or maximum
+    value occurs several times, the lowest index is reported.
+    
+    Args:
+        arr (list): List of comparable elements
+        
+    Returns:
+        tuple: (min_element, max_element, min_index, max_index) or (None, None, -1, -1) for empty array
+        
+    Examples:
+        >>> linear_search_min_max_pairwise([3, 1, 4, 1, 5, 9, 2, 9])
+        (1, 9, 1, 5)
+    """
+    n = len(arr)
+    if n == 0:
+        return None, None, -1, -1
+    
+    # Odd length: the first element seeds both; even: the first pair does
+    if n % 2:
+        min_val = max_val = arr[0]
+        min_idx = max_idx = 0
+        start = 1
+    else:
+        a, b = arr[0], arr[1]
+        if b < a:
+            min_val, min_idx, max_val, max_idx = b, 1, a, 0
+        elif a < b:
+            min_val, min_idx, max_val, max_idx = a, 0, b, 1
+        else:
+            min_val, min_idx, max_val, max_idx = a, 0, a, 0
+        start = 2
+    
+    for i in range(start, n, 2):
+        a, b = arr[i], arr[i + 1]
+        if b < a:
+            if b < min_val:
+                min_val, min_idx = b, i + 1
+            if a > max_val:
+                max_val, max_idx = a, i
+        else:
+            # a <= b (or unordered): a is the candidate minimum; on a tie
+            # a also wins the maximum because its index is lower
+            if a < min_val:
+                min_val, min_idx = a, i
+            if a < b:
+                if b > max_val:
+                    max_val, max_idx = b, i + 1
+            elif a > max_val:
+                max_val, max_idx = a, i
+    
+    return min_val, max_val, min_idx, max_idx
+
+
+class MinMaxAggregator:
+    """
+    Streaming minimum/maximum with indices, folded chunk by chunk.
+    
+    Each chunk passed to update is reduced with the built-in min and max (and
+    index) when it is a list, tuple or array.array, so the per-element work runs
+    in C; other iterables are scanned pairwise (3 comparisons per 2 elements, as
+    in linear_search_min_max_pairwise) straight from the iterator, without being
+    copied into a list. Indices are global: the first element ever added has
+    index offset.
+    
+    Tie-breaking: the lowest index wins for both the minimum and the maximum,
+    also when two aggregators are merged.
+    
+    Examples:
+        >>> agg = MinMaxAggregator()
+        >>> agg.update([5, 2, 8])
+        >>> agg.update([2, 9, 1])
+        >>> agg.add(9)
+        >>> agg.result()
+        (1, 9, 5, 4)
+    """
+    
+    def __init__(self, offset=0):
+        """
+        Args:
+            offset (int): Global index of the first element that will be added
+        """
+        self.offset = offset
+        self.count = 0
+        self.min_val = self.max_val = None
+        self.min_idx = self.max_idx = -1
+    
+    def add(self, value):
+        """Fold a single element."""
+        i = self.offset + self.count
+        self.count += 1
+        if self.min_idx == -1:
+            self.min_val = self.max_val = value
+            self.min_idx = self.max_idx = i
+        elif value < self.min_val:
+            self.min_val, self.min_idx = value, i
+        elif value > self.max_val:
+            self.max_val, self.max_idx = value, i
+    
+    def update(self, chunk):
+        """
+        Fold a chunk of consecutive elements.
+        
+        Args:
+            chunk: Sequence (or iterable) of the next elements
+        """
+        if not isinstance(chunk, (list, tuple, array)):
+            self._update_pairs(iter(chunk))
+            return
+        if len(chunk) == 0:
+            return
+        
+        low, high = min(chunk), max(chunk)
+        try:
+            result = (low, high, chunk.index(low), chunk.index(high))
+        except ValueError:
+            # NaN extremes never compare equal: use the scan
+            result = linear_search_min_max_pairwise(chunk)
+        
+        low, high, low_idx, high_idx = result
+        base = self.offset + self.count
+        self.count += len(chunk)
+        self._fold(low, high, base + low_idx, base + high_idx)
+    
+    def _update_pairs(self, iterator):
+        """Fold the elements of an iterator two at a time, without materializing it."""
+        i = self.offset + self.count
+        if self.min_idx == -1:
+            # Seed the running extremes with the first element
+            for value in iterator:
+                self.min_val = self.max_val = value
+                self.min_idx = self.max_idx = i
+                i += 1
+                break
+            else:
+                return
+        
+        min_val, max_val = self.min_val, self.max_val
+        min_idx, max_idx = self.min_idx, self.max_idx
+        missing = object()  # fill value marking an odd last element
+        
+        for a, b in zip_longest(iterator, iterator, fillvalue=missing):
+            if b is missing:
+                if a < min_val:
+                    min_val, min_idx = a, i
+                elif a > max_val:
+                    max_val, max_idx = a, i
+                i += 1
+                break
+            if b < a:
+                if b < min_val:
+                    min_val, min_idx = b, i + 1
+                if a > max_val:
+                    max_val, max_idx = a, i
+            else:
+                # Same tie-breaking as linear_search_min_max_pairwise
+                if a < min_val:
+                    min_val, min_idx = a, i
+                if a < b:
+                    if b > max_val:
+                        max_val, max_idx = b, i + 1
+                elif a > max_val:
+                    max_val, max_idx = a, i
+            i += 2
+        
+        self.min_val, self.max_val = min_val, max_val
+        self.min_idx, self.max_idx = min_idx, max_idx
+        self.count = i - self.offset
+    
+    def merge(self, other):
+        """
+        Combine with another aggregator (for example one per chunk or worker).
+        
+        Indices are compared as given, so other should have been created with
+        the offset of the data it covered.
+        
+        Args:
+            other (MinMaxAggregator): Aggregator to fold into this one
+        """
+        self.count += other.count
+        if other.min_idx != -1:
+            self._fold(other.min_val, other.max_val, other.min_idx, other.max_idx)
+    
+    def _fold(self, low, high, low_idx, high_idx):
+        if self.min_idx == -1:
+            self.min_val, self.max_val = low, high
+            self.min_idx, self.max_idx = low_idx, high_idx
+            return
+        if low < self.min_val or (low == self.min_val and low_idx < self.min_idx):
+            self.min_val, self.min_idx = low, low_idx
+        if high > self.max_val or (high == self.max_val and high_idx < self.max_idx):
+            self.max_val, self.max_idx = high, high_idx
+    
+    def result(self):
+        """
+        Returns:
+            tuple: (min_element, max_element, min_index, max_index) or (None, None, -1, -1) if empty
+        """
+        return self.min_val, self.max_val, self.min_idx, self.max_idx
+
+
+def linear_search_min_max_stream(iterable, chunk_size=4096):
+    """
+    Minimum and maximum (with indices) of any iterable, read in chunks.
+    
+    Args:
+        iterable: Any iterable of comparable elements
+        chunk_size (int): Elements pulled per chunk
+        
+    Returns:
+        tuple: (min_element, max_element, min_index, max_index) or (None, None, -1, -1) if empty
+        
+    Examples:
+        >>> linear_search_min_max_stream(iter([4, 7, 1, 7, 1]), chunk_size=2)
+        (1, 7, 2, 1)
+    """
+    aggregator = MinMaxAggregator()
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return aggregator.result()
+        aggregator.update(chunk)
+
+
+def linear_search_fast(arr, target):
+    """
+    Linear search that scans primitive arrays in C instead of the Python loop.
+    
+    The container type decides the fast path:
+    - bytes / bytearray: bytes.find on the raw data
+    - array.array and contiguous memoryview of integers: the target is packed with
+      the same typecode and its byte pattern is located directly in the buffer (no
+      copy); after a match that does not fall on an element boundary, the rest is
+      compared element by element with index(), still in C
+    - NumPy arrays: a vectorized comparison plus np.flatnonzero
+    - lists and tuples: the built-in index method
+    Anything else (and float arrays, where byte equality differs from value
+    equality for 0.0/-0.0 and NaN) goes through the element-wise comparison.
+    
+    Args:
+        arr: Sequence to search (list, tuple, bytes, bytearray, array.array,
+             memoryview or NumPy array)
+        target: Element to search for
+        
+    Returns:
+        int: Index of the first occurrence of target, -1 if not found
+        
+    Examples:
+        >>> linear_search_fast(bytearray(b"hello"), ord("l"))
+        2
+        
+        >>> linear_search_fast(array('i', [64, 34, 25, 12]), 25)
+        2
+        
+        >>> linear_search_fast([1, 2, 3], 6)
+        -1
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        hits = np.flatnonzero(arr == target)
+        return int(hits[0]) if hits.size else -1
+    
+    if isinstance(arr, (bytes, bytearray)):
+        if not isinstance(target, int) and not (isinstance(target, float) and target.is_integer()):
+            return -1
+        target = int(target)
+        return arr.find(target) if 0 <= target < 256 else -1
+    
+    if isinstance(arr, array) or (isinstance(arr, memoryview) and arr.c_contiguous):
+        typecode = arr.typecode if isinstance(arr, array) else arr.format
+        if len(typecode) == 1 and typecode in "bBhHiIlLqQ":
+            try:
+                needle = array(typecode, [target])
+            except OverflowError:
+                return -1  # out of range for this element type: cannot be present
+            except TypeError:
+                needle = None  # e.g. a float target: fall back to value comparison
+            if needle is not None and needle[0] == target:
+                return _buffer_find(arr, needle)
+    
+    if isinstance(arr, (list, tuple, array)):
+        try:
+            return arr.index(target)
+        except ValueError:
+            return -1
+    
+    return linear_search(arr, target)
+
+
+def _buffer_find(arr, needle):
+    """Element index of the first occurrence of needle[0] in arr's buffer, or -1."""
+    data = memoryview(arr).cast('B')
+    itemsize = needle.itemsize
+    match = re.search(re.escape(needle.tobytes()), data)
+    if match is None:
+        return -1
+    offset = match.start()
+    if offset % itemsize == 0:
+        return offset // itemsize
+    
+    # The bytes straddle two elements. Inputs that do this once can do it on
+    # every element, so compare whole elements in C from the next boundary on
+    start = offset // itemsize + 1
+    target = needle[0]
+    if isinstance(arr, array):
+        try:
+            return arr.index(target, start)
+        except ValueError:
+            return -1
+    
+    # A memoryview has no index(): copy doubling blocks into an array so the
+    # work stays proportional to the distance to the match
+    n = len(data) // itemsize
+    block = 256
+    while start < n:
+        stop = min(n, start + block)
+        values = array(needle.typecode)
+        values.frombytes(data[start * itemsize:stop * itemsize])
+        try:
+            return start + values.index(target)
+        except ValueError:
+            pass
+        start = stop
+        block *= 2
+    return -1
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     # Test cases for basic linear search
@@ -244,7 +794,44 @@ if __name__ == "__main__":
     print(f"Target: {target}")
     indices = linear_search_all_indices(test_array, target)
     print(f"All indices: {indices}")
-    
+
+    # Many targets in a single pass
+    print("\n=== Multi-Target Search (one pass) ===")
+    test_array = [64, 34, 25, 12, 22, 11, 90, 25]
+    targets = [25, 90, 7]
+    print(f"Array: {test_array}")
+    print(f"Targets: {targets}")
+    print(f"First positions: {linear_search_many(test_array, targets)}")
+    print(f"All positions:   {linear_search_many(test_array, targets, all_indices=True, as_dict=True)}")
+
+    import random
+    import time
+    rng = random.Random(0)
+    ids = rng.sample(range(10**9), 200_000)
+    wanted = [rng.choice(ids) if rng.random() < 0.5 else -i for i in range(2_000)]
+    start = time.perf_counter()
+    one_by_one = [linear_search_fast(ids, target) for target in wanted]
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = linear_search_many(ids, wanted)
+    many_time = time.perf_counter() - start
+    print(f"2,000 targets in 200,000 IDs: one search per target {loop_time:.3f}s, "
+          f"linear_search_many {many_time:.3f}s (same result: {one_by_one == batched})")
+
+    # Lazy variants over plain iterators and chunked readers
+    print("\n=== Streaming Search (stops after limit) ===")
+    import io
+    log = io.StringIO("".join(f"{'ERROR' if i % 1000 == 7 else 'ok'} line {i}\n"
+                              for i in range(100_000)))
+    hits = list(linear_search_condition_iter(log, lambda line: line.startswith("ERROR"),
+                                             limit=3))
+    print(f"First 3 ERROR lines: {hits}, stopped at byte {log.tell():,} "
+          f"of {len(log.getvalue()):,}")
+    raw = io.BytesIO(b"a,b,c\nd,e\nf\n" * 1000)
+    chunks = iter(lambda: raw.read(4096), b"")
+    newlines = linear_search_chunks_iter(chunks, ord("\n"), limit=5)
+    print(f"First 5 newlines via chunked reader: {list(newlines)}")
+
     # Test recursive version
     print("\n=== Recursive Linear Search ===")
     test_array = [10, 23, 45, 70, 11, 15]
@@ -297,9 +884,31 @@ if __name__ == "__main__":
     min_val, max_val, min_idx, max_idx = linear_search_min_max(test_array)
     print(f"Minimum: {min_val} at index {min_idx}")
     print(f"Maximum: {max_val} at index {max_idx}")
+    print(f"Pairwise (3n/2 comparisons): {linear_search_min_max_pairwise(test_array)}")
+    print(f"Streaming, chunks of 3:      {linear_search_min_max_stream(iter(test_array), 3)}")
     
     # Verbose example for educational purposes
     print("\n=== Verbose Example ===")
     sample_array = [64, 34, 25, 12, 22, 11, 90]
     target = 22
-    linear_search_verbose(sample_array, target)
\ No newline at end of file
+    linear_search_verbose(sample_array, target)
+    
+    # C-level scans for primitive arrays
+    print("\n=== Fast Linear Search on Primitive Arrays ===")
+    import time
+    size = 10_000_000
+    ints = list(range(size))
+    typed = array('q', ints)
+    raw = bytes(size - 1) + b"\x01"
+    
+    for name, data, target in (("list", ints, size - 1),
+                               ("array('q')", typed, size - 1),
+                               ("bytes", raw, 1)):
+        start = time.perf_counter()
+        slow = linear_search(data, target)
+        slow_time = time.perf_counter() - start
+        start = time.perf_counter()
+        fast = linear_search_fast(data, target)
+        fast_time = time.perf_counter() - start
+        print(f"  {name:11} n={size:,}: linear_search {slow_time:.3f}s, "
+              f"linear_search_fast {fast_time:.4f}s (same result: {slow == fast})")
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+Row- and Column-Sorted Matrix Search (Staircase / Saddleback Search)
+
+binary_search_2d_matrix needs a matrix whose rows continue one another (each row
+starts after the previous one ends), so it can be treated as one sorted array. Many
+matrices are only sorted along each row and down each column, for example:
+
+    [ 1,  4,  7, 11]
+    [ 2,  5,  8, 12]
+    [ 3,  6,  9, 16]
+    [10, 13, 14, 17]
+
+Here a single binary search does not work. Staircase (saddleback) search starts in the
+top-right corner: if the current value is too large the whole column below it is too
+large, so it moves left; if it is too small the whole row to its left is too small,
+so it moves down. Each step discards a row or a column.
+
+Variants provided:
+- staircase_search: nested lists, O(m + n)
+- staircase_search_flat: one flat array plus a row stride, no nested lists needed
+- matrix_search_divide_conquer: binary search the middle row, then recurse into the
+  two sub-matrices that can still hold the target; O(n log(m/n)) for n <= m,
+  faster than staircase on very tall or very wide matrices
+- staircase_search_many: many targets at once, switching to a single hashing pass
+  over the matrix when that is cheaper than one staircase walk per target
+
+Time Complexity:
+- Staircase: O(m + n) for an m × n matrix
+- Divide and conquer: O(n log(m/n)) with n the smaller dimension
+
+Space Complexity: O(1) (O(log) stack for divide and conquer)
+
+Prerequisites: Every row and every column sorted in ascending order
+"""
+
+from bisect import bisect_left
+
+
+def staircase_search(matrix, target):
+    """
+    Search a row- and column-sorted matrix by walking from the top-right corner.
+
+    Args:
+        matrix (list of lists): Matrix sorted along rows and down columns
+        target: Element to search for
+
+    Returns:
+        tuple: (row, col) of an occurrence of target, (-1, -1) if not found
+
+    Examples:
+        >>> m = [[1, 4, 7, 11], [2, 5, 8, 12], [3, 6, 9, 16], [10, 13, 14, 17]]
+        >>> staircase_search(m, 5)
+        (1, 1)
+
+        >>> staircase_search(m, 15)
+        (-1, -1)
+    """
+    if not matrix or not matrix[0]:
+        return (-1, -1)
+
+    rows = len(matrix)
+    row = 0
+    col = len(matrix[0]) - 1
+
+    while row < rows and col >= 0:
+        value = matrix[row][col]
+        if value == target:
+            return (row, col)
+        elif value > target:
+            col -= 1  # everything below is larger too
+        else:
+            row += 1  # everything to the left is smaller too
+
+    return (-1, -1)
+
+
+def staircase_search_flat(data, rows, cols, target, stride=None):
+    """
+    Staircase search over a matrix stored in one flat array (row-major).
+
+    Args:
+        data: Flat sequence (list, array.array, memoryview, ...)
+        rows (int): Number of rows
+        cols (int): Number of columns
+        target: Element to search for
+        stride (int): Distance between the starts of consecutive rows
+                      (defaults to cols)
+
+    Returns:
+        tuple: (row, col) of an occurrence of target, (-1, -1) if not found
+
+    Examples:
+        >>> staircase_search_flat([1, 4, 7, 2, 5, 8, 3, 6, 9], 3, 3, 6)
+        (2, 1)
+    """
+    if stride is None:
+        stride = cols
+    if rows <= 0 or cols <= 0:
+        return (-1, -1)
+
+    row = 0
+    col = cols - 1
+    index = col
+
+    while row < rows and col >= 0:
+        value = data[index]
+        if value == target:
+            return (row, col)
+        elif value > target:
+            col -= 1
+            index -= 1
+        else:
+            row += 1
+            index += stride
+
+    return (-1, -1)
+
+
+def matrix_search_divide_conquer(matrix, target):
+    """
+    Search a row- and column-sorted matrix by binary searching middle rows.
+
+    In the middle row of the current sub-matrix, binary search finds the column j
+    where the target would go. Everything above-left of that split is too small
+    and everything below-right is too large, so only the bottom-left and top-right
+    sub-matrices still need to be searched.
+
+    Args:
+        matrix (list of lists): Matrix sorted along rows and down columns
+        target: Element to search for
+
+    Returns:
+        tuple: (row, col) of an occurrence of target, (-1, -1) if not found
+
+    Examples:
+        >>> m = [[1, 4, 7, 11], [2, 5, 8, 12], [3, 6, 9, 16], [10, 13, 14, 17]]
+        >>> matrix_search_divide_conquer(m, 13)
+        (3, 1)
+    """
+    if not matrix or not matrix[0]:
+        return (-1, -1)
+
+    # Sub-matrices as half-open (row_lo, row_hi, col_lo, col_hi)
+    stack = [(0, len(matrix), 0, len(matrix[0]))]
+
+    while stack:
+        row_lo, row_hi, col_lo, col_hi = stack.pop()
+        if row_lo >= row_hi or col_lo >= col_hi:
+            continue
+
+        # Quick rejection using the sub-matrix's corner values
+        if target < matrix[row_lo][col_lo] or target > matrix[row_hi - 1][col_hi - 1]:
+            continue
+
+        mid = (row_lo + row_hi) // 2
+        row = matrix[mid]
+        col = bisect_left(row, target, col_lo, col_hi)
+
+        if col < col_hi and row[col] == target:
+            return (mid, col)
+
+        # row[col_lo:col] < target < row[col:col_hi]
+        stack.append((mid + 1, row_hi, col_lo, col))  # bottom-left
+        stack.append((row_lo, mid, col, col_hi))      # top-right
+
+    return (-1, -1)
+
+
+def staircase_search_many(matrix, targets, shape=None, stride=None):
+    """
+    Search a row- and column-sorted matrix for many targets.
+
+    With k targets on an m × n matrix, one staircase walk per target costs
+    O(k (m + n)). When that exceeds the O(m n) of reading the whole matrix once,
+    a single pass records the first position of every wanted value instead.
+
+    Args:
+        matrix: Nested lists, or a flat row-major sequence when shape is given
+        targets (list): Elements to search for
+        shape (tuple): (rows, cols) of a flat matrix
+        stride (int): Row stride of a flat matrix (defaults to cols)
+
+    Returns:
+        list: (row, col) or (-1, -1) for each target, in the input order
+
+    Examples:
+        >>> m = [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+        >>> staircase_search_many(m, [6, 10, 1])
+        [(2, 1), (-1, -1), (0, 0)]
+    """
+    if shape is None:
+        rows = len(matrix)
+        cols = len(matrix[0]) if rows else 0
+    else:
+        rows, cols = shape
+        if stride is None:
+            stride = cols
+
+    if rows == 0 or cols == 0:
+        return [(-1, -1)] * len(targets)
+
+    if len(targets) * (rows + cols) <= rows * cols:
+        if shape is None:
+            return [staircase_search(matrix, target) for target in targets]
+        return [staircase_search_flat(matrix, rows, cols, target, stride)
+                for target in targets]
+
+    # Dense batch: one pass over the matrix, keeping the first hit of each target
+    wanted = set(targets)
+    found = {}
+    for r in range(rows):
+        if shape is None:
+            row_values = matrix[r]
+        else:
+            row_values = matrix[r * stride:r * stride + cols]
+        for c, value in enumerate(row_values):
+            if value in wanted and value not in found:
+                found[value] = (r, c)
+
+    return [found.get(target, (-1, -1)) for target in targets]
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    from array import array
+
+    matrix = [
+        [1,  4,  7,  11],
+        [2,  5,  8,  12],
+        [3,  6,  9,  16],
+        [10, 13, 14, 17]
+    ]
+
+    print("=== Row/Column-Sorted Matrix ===")
+    for row in matrix:
+        print(f"  {row}")
+
+    print("\n=== Staircase vs Divide and Conquer ===")
+    for target in (5, 13, 17, 1, 15, 0, 18):
+        print(f"  target {target:2d}: staircase {staircase_search(matrix, target)}, "
+              f"divide & conquer {matrix_search_divide_conquer(matrix, target)}")
+
+    print("\n=== Flat Storage (array + stride) ===")
+    flat = array('i', [value for row in matrix for value in row])
+    print(f"  Flat data: {flat.tolist()}")
+    print(f"  target 9: {staircase_search_flat(flat, 4, 4, 9)}")
+    print(f"  left two columns (4×2, stride 4), target 6: "
+          f"{staircase_search_flat(flat, 4, 2, 6, stride=4)}")
+
+    print("\n=== Batched Targets ===")
+    targets = [9, 3, 20, 16]
+    print(f"  targets {targets}: {staircase_search_many(matrix, targets)}")
+    print(f"  flat:            {staircase_search_many(flat, targets, shape=(4, 4))}")
+
+    print("\n=== Randomised Check ===")
+    rng = random.Random(0)
+    ok = True
+    for _ in range(300):
+        rows, cols = rng.randint(1, 8), rng.randint(1, 8)
+        m = [[0] * cols for _ in range(rows)]
+        for r in range(rows):
+            for c in range(cols):
+                above = m[r - 1][c] if r else 0
+                left = m[r][c - 1] if c else 0
+                m[r][c] = max(above, left) + rng.randint(0, 3)
+        flat_m = [value for row in m for value in row]
+        for target in range(-1, m[-1][-1] + 2):
+            present = any(target in row for row in m)
+            for result in (staircase_search(m, target),
+                           matrix_search_divide_conquer(m, target),
+                           staircase_search_flat(flat_m, rows, cols, target)):
+                if present:
+                    ok &= result != (-1, -1) and m[result[0]][result[1]] == target
+                else:
+                    ok &= result == (-1, -1)
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
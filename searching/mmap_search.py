@@ -0,0 +1,419 @@
+"""
+Binary Search Over Memory-Mapped Sorted Files
+
+Sorted data that lives on disk does not have to be loaded into a list before it can be
+binary searched. Memory-mapping the file lets the search read just the bytes it
+probes; the operating system pages them in on demand, so a lookup touches only
+O(log n) pages of a file that may be many gigabytes long.
+
+Two file layouts are supported:
+- MappedSortedFile: fixed-width binary records described by a struct format
+  (for example '<q' for little-endian 64-bit IDs). Record i starts at byte
+  i * record_size, so any record can be reached directly. When the file is a plain
+  array of native-endian numbers it is viewed through a typed memoryview and
+  searched with the C bisect functions.
+- MappedSortedTextFile: newline-separated text sorted by line (or by a key parsed
+  from each line). Probes land at arbitrary byte offsets and are moved back to the
+  start of the line that contains them.
+
+Queries mirror the binary_search functions (point, leftmost, rightmost) and add
+half-open [lo, hi) range queries.
+
+Time Complexity: O(log n) probes per lookup (O(log size) for the text variant)
+Space Complexity: O(1) - nothing is read into memory beyond the probed pages
+
+Prerequisites: File contents must be sorted in ascending key order
+"""
+
+import mmap
+import struct
+import sys
+from bisect import bisect_left, bisect_right
+
+
+class MappedSortedFile:
+    """
+    Sorted fixed-width binary records searched in place through mmap.
+
+    Examples:
+        >>> with MappedSortedFile("ids.bin", "<q") as ids:   # doctest: +SKIP
+        ...     ids.search(42), ids.search_range(100, 200)
+        (7, (12, 19))
+    """
+
+    # struct formats that match a memoryview typecode on little-endian machines
+    _TYPED_FORMATS = {'<q': 'q', '<Q': 'Q', '<i': 'i', '<I': 'I', '<d': 'd', '<f': 'f',
+                      '<h': 'h', '<H': 'H', '<b': 'b', '<B': 'B'}
+
+    def __init__(self, path, record_format='<q', key_field=0):
+        """
+        Args:
+            path (str): Path of the sorted binary file
+            record_format (str): struct format of one record (e.g. '<q' or '<qd16s')
+            key_field (int): Which field of the unpacked record is the sort key
+        """
+        self._struct = struct.Struct(record_format)
+        self._record_size = self._struct.size
+        self._key_field = key_field
+        self._file = open(path, 'rb')
+        self._map = None
+        self._keys = None
+
+        size = self._file.seek(0, 2)
+        if size % self._record_size:
+            self._file.close()
+            raise ValueError(f"File size {size} is not a multiple of the record size "
+                             f"{self._record_size}")
+        self._n = size // self._record_size
+
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            typecode = self._TYPED_FORMATS.get(record_format)
+            if typecode and sys.byteorder == 'little':
+                # Plain array of numbers: bisect can index the mapped memory directly
+                self._keys = memoryview(self._map).cast(typecode)
+
+    def close(self):
+        """Release the memory map and the file."""
+        if self._keys is not None:
+            self._keys.release()
+            self._keys = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    def record(self, index):
+        """
+        Unpack the record at a position.
+
+        Args:
+            index (int): Record number
+
+        Returns:
+            tuple: The unpacked record fields
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("record index out of range")
+        return self._struct.unpack_from(self._map, index * self._record_size)
+
+    def key(self, index):
+        """Sort key of the record at a position."""
+        return self.record(index)[self._key_field]
+
+    def _bound(self, target, strict, lo=0):
+        """Index of the first key >= target (> target when strict), searching from lo."""
+        if self._keys is not None:
+            search = bisect_right if strict else bisect_left
+            return search(self._keys, target, lo)
+
+        unpack_from = self._struct.unpack_from
+        data = self._map
+        size = self._record_size
+        field = self._key_field
+        hi = self._n
+
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            key = unpack_from(data, mid * size)[field]
+            if key < target or (strict and key == target):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def search_insertion_point(self, target):
+        """
+        Same as binary_search_insertion_point.
+
+        Args:
+            target: Key to locate
+
+        Returns:
+            int: Record number where target would be inserted
+        """
+        return self._bound(target, False)
+
+    def search_leftmost(self, target):
+        """
+        Same as binary_search_leftmost.
+
+        Args:
+            target: Key to search for
+
+        Returns:
+            int: Record number of the first match, -1 if not found
+        """
+        i = self._bound(target, False)
+        return i if i < self._n and self.key(i) == target else -1
+
+    def search_rightmost(self, target):
+        """
+        Same as binary_search_rightmost.
+
+        Args:
+            target: Key to search for
+
+        Returns:
+            int: Record number of the last match, -1 if not found
+        """
+        i = self._bound(target, True) - 1
+        return i if i >= 0 and self.key(i) == target else -1
+
+    def search(self, target):
+        """
+        Same contract as binary_search: a record number holding target, or -1.
+
+        Args:
+            target: Key to search for
+
+        Returns:
+            int: Record number of the leftmost match, -1 if not found
+        """
+        return self.search_leftmost(target)
+
+    def search_range(self, lo, hi):
+        """
+        Record numbers of keys in the half-open interval [lo, hi).
+
+        Args:
+            lo: Inclusive lower key bound
+            hi: Exclusive upper key bound
+
+        Returns:
+            tuple: (start, stop) such that records start..stop-1 match
+        """
+        start = self._bound(lo, False)
+        stop = self._bound(hi, False, start) if hi > lo else start
+        return (start, stop)
+
+    def iter_range(self, lo, hi):
+        """
+        Iterate over the records with keys in [lo, hi).
+
+        Args:
+            lo: Inclusive lower key bound
+            hi: Exclusive upper key bound
+
+        Yields:
+            tuple: Unpacked records in key order
+        """
+        start, stop = self.search_range(lo, hi)
+        for index in range(start, stop):
+            yield self.record(index)
+
+
+class MappedSortedTextFile:
+    """
+    Sorted newline-separated text searched in place through mmap.
+
+    Lines are compared as raw bytes (without the trailing newline) unless a key
+    function is given, e.g. key=int for a file of sorted decimal IDs.
+    Positions are byte offsets of line starts.
+
+    Examples:
+        >>> with MappedSortedTextFile("ids.txt", key=int) as ids:   # doctest: +SKIP
+        ...     ids.read_line(ids.search(42))
+        b'42'
+    """
+
+    def __init__(self, path, key=None):
+        """
+        Args:
+            path (str): Path of the sorted text file
+            key (function): Maps a line (bytes, without newline) to its sort key
+        """
+        self._key = key
+        self._file = open(path, 'rb')
+        self._size = self._file.seek(0, 2)
+        self._map = None
+        if self._size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        """Release the memory map and the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _line_end(self, start):
+        """Offset just past the line starting at start (after its newline)."""
+        end = self._map.find(b'\n', start)
+        return self._size if end == -1 else end + 1
+
+    def read_line(self, offset):
+        """
+        Read the line starting at a byte offset.
+
+        Args:
+            offset (int): Byte offset of a line start
+
+        Returns:
+            bytes: The line without its trailing newline
+        """
+        line = self._map[offset:self._line_end(offset)]
+        return line[:-1] if line.endswith(b'\n') else line
+
+    def _line_key(self, start, end):
+        line = self._map[start:end]
+        if line.endswith(b'\n'):
+            line = line[:-1]
+        return self._key(line) if self._key else line
+
+    def _bound(self, target, strict, lo=0):
+        """Offset of the first line with key >= target (> target when strict)."""
+        if self._map is None:
+            return 0
+
+        data = self._map
+        hi = self._size
+
+        # lo and hi always sit on line starts (or the end of the file)
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            newline = data.rfind(b'\n', lo, mid)
+            start = newline + 1 if newline != -1 else lo
+            end = self._line_end(start)
+
+            key = self._line_key(start, end)
+            if key < target or (strict and key == target):
+                lo = end
+            else:
+                hi = start
+        return lo
+
+    def search_insertion_point(self, target):
+        """
+        Byte offset where a line with this key would be inserted.
+
+        Args:
+            target: Key to locate
+
+        Returns:
+            int: Offset of the first line whose key is >= target (file size if none)
+        """
+        return self._bound(target, False)
+
+    def search_leftmost(self, target):
+        """
+        Offset of the first line whose key equals target.
+
+        Args:
+            target: Key to search for
+
+        Returns:
+            int: Byte offset of the line, -1 if not found
+        """
+        offset = self._bound(target, False)
+        if offset < self._size and self._line_key(offset, self._line_end(offset)) == target:
+            return offset
+        return -1
+
+    def search_rightmost(self, target):
+        """
+        Offset of the last line whose key equals target.
+
+        Args:
+            target: Key to search for
+
+        Returns:
+            int: Byte offset of the line, -1 if not found
+        """
+        first = self.search_leftmost(target)
+        if first == -1:
+            return -1
+        end = self._bound(target, True, first)
+        # Step back from the end to the start of the last matching line
+        newline = self._map.rfind(b'\n', first, end - 1)
+        return newline + 1 if newline != -1 else first
+
+    def search(self, target):
+        """
+        Same contract as binary_search, with byte offsets as positions.
+
+        Args:
+            target: Key to search for
+
+        Returns:
+            int: Byte offset of the first matching line, -1 if not found
+        """
+        return self.search_leftmost(target)
+
+    def iter_range(self, lo, hi):
+        """
+        Iterate over the lines with keys in the half-open interval [lo, hi).
+
+        Args:
+            lo: Inclusive lower key bound
+            hi: Exclusive upper key bound
+
+        Yields:
+            bytes: Matching lines (without newlines) in file order
+        """
+        offset = self._bound(lo, False)
+        while offset < self._size:
+            end = self._line_end(offset)
+            if not self._line_key(offset, end) < hi:
+                return
+            yield self.read_line(offset)
+            offset = end
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    rng = random.Random(0)
+    ids = sorted(rng.sample(range(10**9), 100_000))
+
+    with tempfile.TemporaryDirectory() as directory:
+        binary_path = os.path.join(directory, "ids.bin")
+        with open(binary_path, "wb") as f:
+            f.write(struct.pack(f"<{len(ids)}q", *ids))
+
+        print("=== Fixed-Width Binary File (typed memoryview path) ===\n")
+        with MappedSortedFile(binary_path, "<q") as mapped:
+            target = ids[1234]
+            print(f"Records: {len(mapped)}")
+            print(f"search({target}) = {mapped.search(target)} (Expected: 1234)")
+            print(f"search(-5) = {mapped.search(-5)}")
+            start, stop = mapped.search_range(ids[10], ids[15])
+            print(f"search_range(ids[10], ids[15]) = {(start, stop)}")
+
+        print("\n=== Records With Payload (struct path) ===\n")
+        record_path = os.path.join(directory, "records.bin")
+        with open(record_path, "wb") as f:
+            for i, value in enumerate(ids[:1000]):
+                f.write(struct.pack("<qd8s", value, i * 0.5, b"payload"))
+        with MappedSortedFile(record_path, "<qd8s") as records:
+            index = records.search(ids[500])
+            print(f"search(ids[500]) = {index}, record = {records.record(index)}")
+            print(f"rightmost of a missing key: {records.search_rightmost(ids[500] + 1)}")
+
+        print("\n=== Sorted Text File ===\n")
+        text_path = os.path.join(directory, "ids.txt")
+        with open(text_path, "w") as f:
+            f.write("\n".join(str(value) for value in ids[:1000]))
+        with MappedSortedTextFile(text_path, key=int) as lines:
+            offset = lines.search(ids[700])
+            print(f"search(ids[700]) -> offset {offset}, line {lines.read_line(offset)!r}")
+            print(f"search(-5) -> {lines.search(-5)}")
+            print(f"iter_range(ids[3], ids[6]) -> {list(lines.iter_range(ids[3], ids[6]))}")
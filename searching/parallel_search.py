@@ -0,0 +1,362 @@
+"""
+Parallel Chunked Linear Search
+
+A plain linear search uses one core. For very large unsorted inputs the scan can be
+split into chunks and run on a pool of worker processes. Two details make this
+behave like the sequential search:
+
+- Globally first match: chunks are handed out in index order and the result is the
+  smallest matching index found, so the answer is identical to linear_search.
+- Early cancellation: workers share one integer, the best (lowest) match index
+  known so far. Every worker checks it between blocks and stops as soon as a lower
+  index has been found, and chunks that have not started yet are cancelled.
+  First-match latency therefore shrinks with the number of cores instead of
+  waiting for the whole input to be scanned.
+
+Typed data (array.array, bytes, bytearray) is copied once into a shared-memory
+block that all workers map, so it is not pickled to each process. Other sequences
+are inherited without copying when the workers are forked; under the spawn and
+forkserver start methods each task is sent only its own chunk slice, so the list
+is pickled once in total rather than once per worker. Inside a chunk, equality searches use linear_search_fast,
+so each worker also scans in C where the data type allows it.
+
+linear_search_min_max_parallel uses the same pool for a reduction: every chunk is
+folded into a MinMaxAggregator and the partial results are merged in index order.
+
+Time Complexity: O(n / p) per worker for p workers (O(n) total work in the worst case)
+Space Complexity: O(n) shared memory for typed data, O(1) per worker otherwise
+"""
+
+import atexit
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value, get_start_method
+from multiprocessing.shared_memory import SharedMemory
+
+if __name__ == "__main__":
+    # Only needed for direct runs, which put searching/ rather than its parent on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from searching.linear_search import (MinMaxAggregator, linear_search_fast,
+                                     linear_search_with_condition)
+
+
+# Number of elements a worker scans between checks of the shared best index
+BLOCK_SIZE = 1 << 16
+
+# Inputs smaller than this are searched sequentially; process start-up would dominate
+MIN_PARALLEL_SIZE = 1 << 20
+
+
+# Per-process state installed by _init_worker
+_worker = {}
+
+
+def _init_worker(best, shm_name, typecode, length, data, target, condition_func):
+    """Pool initializer: attach the shared data and remember the query."""
+    if shm_name is not None:
+        shm = SharedMemory(name=shm_name)
+        view = shm.buf.cast(typecode)
+        data = view[:length]
+        # The exported views must be released before the block can be closed;
+        # otherwise SharedMemory.__del__ raises BufferError at interpreter exit
+        atexit.register(_detach_worker, shm, view, data)
+        _worker['shm'] = shm
+    _worker['typecode'] = typecode
+    _worker['data'] = data
+    _worker['best'] = best
+    _worker['target'] = target
+    _worker['condition'] = condition_func
+
+
+def _detach_worker(shm, *views):
+    """Worker exit hook: release the views of the shared block, then close it."""
+    for view in views:
+        view.release()
+    shm.close()
+
+
+def _scan_chunk(start, stop, chunk=None):
+    """
+    Scan data[start:stop] block by block in a worker process.
+
+    Args:
+        start (int): Global index of the first element to scan
+        stop (int): Global index one past the last element to scan
+        chunk: The elements data[start:stop] when they are sent with the task
+               instead of being installed by _init_worker
+
+    Returns:
+        int: Global index of the first match in the chunk, or -1 if there is none
+             or a lower match was found elsewhere first
+    """
+    if chunk is None:
+        data, base = _worker['data'], 0
+    else:
+        data, base = chunk, start
+    best = _worker['best']
+    target = _worker['target']
+    condition_func = _worker['condition']
+
+    for lo in range(start, stop, BLOCK_SIZE):
+        if best.value < lo:
+            return -1  # someone already found a match before this block
+
+        hi = min(lo + BLOCK_SIZE, stop)
+        if condition_func is None:
+            if isinstance(data, memoryview):
+                index = linear_search_fast(data[lo - base:hi - base], target)
+            else:
+                try:
+                    index = data.index(target, lo - base, hi - base) + base - lo
+                except ValueError:
+                    index = -1
+        else:
+            index = -1
+            for i in range(lo - base, hi - base):
+                if condition_func(data[i]):
+                    index = i + base - lo
+                    break
+
+        if index != -1:
+            found = lo + index
+            with best.get_lock():
+                if found < best.value:
+                    best.value = found
+            return found
+
+    return -1
+
+
+def _share(arr):
+    """
+    Place typed data in shared memory for the workers.
+
+    Returns:
+        tuple: (shm, shm_name, typecode, data) - the SharedMemory block (or None)
+               plus the initializer arguments describing where workers find the data;
+               data is None when each task has to be sent its own chunk instead
+    """
+    if not isinstance(arr, (array, bytes, bytearray)):
+        # Forked workers inherit the parent's memory; any other start method
+        # would pickle the whole sequence into every worker's initializer
+        return None, None, None, (arr if get_start_method() == 'fork' else None)
+
+    source = memoryview(arr).cast('B')
+    shm = SharedMemory(create=True, size=max(1, source.nbytes))
+    shm.buf[:source.nbytes] = source
+    typecode = arr.typecode if isinstance(arr, array) else 'B'
+    return shm, shm.name, typecode, None
+
+
+def _release(shm):
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+
+def _parallel_first(arr, target, condition_func, workers, chunk_size):
+    """Shared driver for the parallel first-match searches."""
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or n < MIN_PARALLEL_SIZE:
+        if condition_func is None:
+            return linear_search_fast(arr, target)
+        return linear_search_with_condition(arr, condition_func)
+
+    if chunk_size is None:
+        # A few chunks per worker so early chunks finish (and cancel the rest) quickly
+        chunk_size = max(BLOCK_SIZE, -(-n // (workers * 4)))
+
+    shm, shm_name, typecode, data = _share(arr)
+    best = Value('q', n)  # n means "no match yet"
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(best, shm_name, typecode, n, data,
+                                           target, condition_func)) as pool:
+            futures = []
+            for start in range(0, n, chunk_size):
+                stop = min(start + chunk_size, n)
+                chunk = arr[start:stop] if shm is None and data is None else None
+                futures.append(pool.submit(_scan_chunk, start, stop, chunk))
+
+            # Results in index order: the first chunk with a match holds the answer
+            for future in futures:
+                result = future.result()
+                if result != -1:
+                    for pending in futures:
+                        pending.cancel()
+                    return result
+            return -1
+    finally:
+        _release(shm)
+
+
+def _min_max_chunk(start, stop, chunk=None):
+    """Reduce data[start:stop] (or the chunk sent with the task) to an aggregator."""
+    if chunk is None:
+        data = _worker['data']
+        if isinstance(data, memoryview):
+            chunk = array(_worker['typecode'])
+            chunk.frombytes(data[start:stop].cast('B'))
+        else:
+            chunk = data[start:stop]
+
+    aggregator = MinMaxAggregator(offset=start)
+    aggregator.update(chunk)
+    return aggregator
+
+
+def linear_search_min_max_parallel(arr, workers=None, chunk_size=None):
+    """
+    Minimum and maximum (with indices) computed by a pool of worker processes.
+
+    Every worker reduces its chunks with MinMaxAggregator; the per-chunk results
+    are merged in index order. As in linear_search_min_max, the lowest index wins
+    when the minimum or maximum value occurs more than once.
+
+    Args:
+        arr: Sequence of comparable elements
+        workers (int): Number of processes (defaults to os.cpu_count())
+        chunk_size (int): Elements per task (defaults to a few chunks per worker)
+
+    Returns:
+        tuple: (min_element, max_element, min_index, max_index) or (None, None, -1, -1) if empty
+
+    Examples:
+        >>> linear_search_min_max_parallel([3, 1, 4, 1, 5, 9, 2, 9], workers=2)
+        (1, 9, 1, 5)
+    """
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or n < MIN_PARALLEL_SIZE:
+        aggregator = MinMaxAggregator()
+        aggregator.update(arr)
+        return aggregator.result()
+
+    if chunk_size is None:
+        chunk_size = max(BLOCK_SIZE, -(-n // (workers * 4)))
+
+    shm, shm_name, typecode, data = _share(arr)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(None, shm_name, typecode, n, data,
+                                           None, None)) as pool:
+            total = MinMaxAggregator()
+            starts = range(0, n, chunk_size)
+            stops = [min(start + chunk_size, n) for start in starts]
+            if shm is None and data is None:
+                chunks = [arr[start:stop] for start, stop in zip(starts, stops)]
+            else:
+                chunks = [None] * len(starts)
+            for partial in pool.map(_min_max_chunk, starts, stops, chunks):
+                total.merge(partial)
+            return total.result()
+    finally:
+        _release(shm)
+
+
+def linear_search_parallel(arr, target, workers=None, chunk_size=None):
+    """
+    Find the first occurrence of target using a pool of worker processes.
+
+    Args:
+        arr: Sequence to search (list, array.array, bytes, bytearray, ...)
+        target: Element to search for
+        workers (int): Number of processes (defaults to os.cpu_count())
+        chunk_size (int): Elements per task (defaults to a few chunks per worker)
+
+    Returns:
+        int: Index of the first occurrence of target, -1 if not found
+
+    Examples:
+        >>> linear_search_parallel(list(range(10)), 7, workers=2)
+        7
+    """
+    return _parallel_first(arr, target, None, workers, chunk_size)
+
+
+def linear_search_with_condition_parallel(arr, condition_func, workers=None, chunk_size=None):
+    """
+    Find the first element satisfying a condition using a pool of worker processes.
+
+    The condition is given to the workers when the pool starts. On platforms that
+    start workers with fork any function works; elsewhere it must be picklable
+    (a module-level function rather than a lambda).
+
+    Args:
+        arr: Sequence to search
+        condition_func (function): Returns True for the desired element
+        workers (int): Number of processes (defaults to os.cpu_count())
+        chunk_size (int): Elements per task (defaults to a few chunks per worker)
+
+    Returns:
+        int: Index of first element satisfying the condition, -1 if none found
+
+    Examples:
+        >>> linear_search_with_condition_parallel([1, 3, 5, 8, 12], lambda x: x > 7)
+        3
+    """
+    return _parallel_first(arr, None, condition_func, workers, chunk_size)
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.linear_search import linear_search, linear_search_min_max
+
+    size = 20_000_000
+    workers = os.cpu_count() or 1
+    print(f"=== Parallel Linear Search ({workers} workers, n={size:,}) ===\n")
+
+    data = array('q', range(size))
+    for position in (size // 10, size - 1, -1):
+        target = position if position >= 0 else -5
+
+        start = time.perf_counter()
+        sequential = linear_search(data, target)
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = linear_search_parallel(data, target)
+        parallel_time = time.perf_counter() - start
+
+        print(f"  target at {position:>11,}: linear_search {sequential_time:.3f}s, "
+              f"parallel {parallel_time:.3f}s, same result: {sequential == parallel}")
+
+    start = time.perf_counter()
+    expected = linear_search_min_max(data)
+    sequential_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = linear_search_min_max_parallel(data)
+    parallel_time = time.perf_counter() - start
+    print(f"\n  min/max: linear_search_min_max {sequential_time:.3f}s, "
+          f"parallel {parallel_time:.3f}s, same result: {expected == result}")
+
+    print("\n=== Parallel Condition Search ===")
+    values = [random.random() for _ in range(5_000_000)]
+    values[3_000_000] = 2.0
+    start = time.perf_counter()
+    index = linear_search_with_condition_parallel(values, lambda x: x > 1.5)
+    print(f"  first value > 1.5 at index {index} ({time.perf_counter() - start:.3f}s)")
+
+    # Workers that are not forked attach to the shared block (typed data) or get
+    # their chunk sent with each task (lists); both must exit cleanly
+    print("\n=== Spawned Workers ===")
+    from multiprocessing import set_start_method
+    set_start_method("spawn", force=True)
+    size = MIN_PARALLEL_SIZE * 2
+    for name, values in (("array('q')", array('q', range(size))), ("list", list(range(size)))):
+        start = time.perf_counter()
+        found = linear_search_parallel(values, size - 3, workers=2)
+        extremes = linear_search_min_max_parallel(values, workers=2)
+        ok = found == size - 3 and extremes == (0, size - 1, 0, size - 1)
+        print(f"  {name:10}: search and min/max in {time.perf_counter() - start:.3f}s, "
+              f"{'✓ PASS' if ok else '✗ FAIL'}")
@@ -0,0 +1,229 @@
+"""
+Sorted Key Index (Key-Projected Binary Search)
+
+Binary searching a list of records by one of their fields normally means either
+building a parallel list of keys before every search or calling a key function on
+every probe. SortedKeyIndex does the projection once: it extracts the keys, sorts the
+records by them, and stores the keys in a compact typed array (array('q') for
+integers, array('d') for floats, a plain list otherwise) next to a list of references
+to the records. Every query is then a bisection over the key array alone, with no
+attribute lookups or key-function calls per probe.
+
+Queries mirror the binary_search functions:
+- find / find_rightmost / find_range: like binary_search_leftmost,
+  binary_search_rightmost and binary_search_range
+- insertion_point: like binary_search_insertion_point
+- range(lo, hi): records whose key lies in the half-open interval [lo, hi)
+
+Time Complexity:
+- Build: O(n log n) (O(n) when the records are already sorted by key)
+- Point and insertion-point queries: O(log n)
+- Range query: O(log n + k) for k reported records
+
+Space Complexity: O(n) - 8 bytes per numeric key plus one reference per record
+"""
+
+import os
+import sys
+from bisect import bisect_left, bisect_right
+
+if __name__ == "__main__":
+    # A script run puts searching/ on sys.path; the package import below needs its parent
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from searching.static_search import compact_array
+
+
+class SortedKeyIndex:
+    """
+    Records sorted by a key, searchable through a precomputed key column.
+
+    Examples:
+        >>> people = [("Bob", 30), ("Alice", 25), ("Diana", 30), ("Eve", 41)]
+        >>> index = SortedKeyIndex(people, key_func=lambda p: p[1])
+        >>> index.find(30), index.find_range(30), index.find(99)
+        (1, (1, 2), -1)
+
+        >>> index.range(26, 41)
+        [('Bob', 30), ('Diana', 30)]
+    """
+
+    def __init__(self, records, key_func, presorted=False):
+        """
+        Args:
+            records (list): Records to index
+            key_func (function): Extracts the sort key from a record (called once per record)
+            presorted (bool): Set when records are already sorted by key to skip sorting
+
+        Raises:
+            ValueError: If presorted is set but the keys are not in ascending order
+        """
+        records = list(records)
+        keys = [key_func(record) for record in records]
+
+        if presorted:
+            for i in range(1, len(keys)):
+                if keys[i] < keys[i - 1]:
+                    raise ValueError(f"Records are not sorted by key at index {i}")
+        else:
+            # Stable sort of positions by key; records with equal keys keep their order
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            records = [records[i] for i in order]
+            keys = [keys[i] for i in order]
+
+        self._keys = compact_array(keys)
+        self._records = records
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def key(self, index):
+        """
+        Key of the record at a position.
+
+        Args:
+            index (int): Position in key order
+
+        Returns:
+            The record's key
+        """
+        return self._keys[index]
+
+    def find(self, key):
+        """
+        Position of the first record with the given key (binary_search_leftmost).
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            int: Position in key order, -1 if not found
+        """
+        keys = self._keys
+        i = bisect_left(keys, key)
+        return i if i < len(keys) and keys[i] == key else -1
+
+    def find_rightmost(self, key):
+        """
+        Position of the last record with the given key (binary_search_rightmost).
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            int: Position in key order, -1 if not found
+        """
+        keys = self._keys
+        i = bisect_right(keys, key) - 1
+        return i if i >= 0 and keys[i] == key else -1
+
+    def find_range(self, key):
+        """
+        First and last positions of records with the given key (binary_search_range).
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            tuple: (first_index, last_index) or (-1, -1) if not found
+        """
+        first = self.find(key)
+        if first == -1:
+            return (-1, -1)
+        return (first, bisect_right(self._keys, key, first) - 1)
+
+    def insertion_point(self, key):
+        """
+        Position where a record with this key would be inserted
+        (binary_search_insertion_point).
+
+        Args:
+            key: Key to locate
+
+        Returns:
+            int: Insertion position in key order
+        """
+        return bisect_left(self._keys, key)
+
+    def get(self, key, default=None):
+        """
+        First record with the given key.
+
+        Args:
+            key: Key to search for
+            default: Value returned when no record has the key
+
+        Returns:
+            The matching record, or default
+        """
+        i = self.find(key)
+        return self._records[i] if i != -1 else default
+
+    def range(self, lo, hi):
+        """
+        Records whose key lies in the half-open interval [lo, hi).
+
+        Args:
+            lo: Inclusive lower key bound
+            hi: Exclusive upper key bound
+
+        Returns:
+            list: Matching records in key order
+        """
+        start = bisect_left(self._keys, lo)
+        stop = bisect_left(self._keys, hi, start)
+        return self._records[start:stop]
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.binary_search import binary_search_leftmost
+
+    class Event:
+        def __init__(self, timestamp, name):
+            self.timestamp = timestamp
+            self.name = name
+
+        def __repr__(self):
+            return f"{self.name}@{self.timestamp}"
+
+    print("=== SortedKeyIndex Over Records ===\n")
+    events = [Event(30, "deploy"), Event(10, "build"), Event(20, "test"),
+              Event(20, "lint"), Event(50, "alert")]
+    index = SortedKeyIndex(events, key_func=lambda e: e.timestamp)
+    print(f"Records in key order: {list(index)}")
+    print(f"find(20):            {index.find(20)}")
+    print(f"find_range(20):      {index.find_range(20)}")
+    print(f"find(40):            {index.find(40)}")
+    print(f"insertion_point(40): {index.insertion_point(40)}")
+    print(f"range(15, 50):       {index.range(15, 50)}")
+
+    print("\n=== Benchmark: 100,000 lookups over 1,000,000 records ===")
+    rng = random.Random(0)
+    records = sorted((Event(rng.randrange(10**9), "e") for _ in range(1_000_000)),
+                     key=lambda e: e.timestamp)
+    queries = [rng.choice(records).timestamp for _ in range(100_000)]
+
+    start = time.perf_counter()
+    keys = [e.timestamp for e in records]  # what callers had to do before
+    for q in queries:
+        binary_search_leftmost(keys, q)
+    plain_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SortedKeyIndex(records, key_func=lambda e: e.timestamp, presorted=True)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for q in queries:
+        index.find(q)
+    index_time = time.perf_counter() - start
+
+    print(f"  key list + binary_search_leftmost: {plain_time:.3f} seconds")
+    print(f"  SortedKeyIndex build:              {build_time:.3f} seconds")
+    print(f"  SortedKeyIndex.find:               {index_time:.3f} seconds")
@@ -0,0 +1,238 @@
+"""
+Sparse Table for Range Minimum / Maximum Queries
+
+Answering "what is the minimum (or maximum) of arr[lo:hi], and where is it?" with
+linear_search_min_max costs O(hi - lo) per query. When many windows of the same
+array are queried, a sparse table answers each one in O(1) after an O(n log n)
+build.
+
+Level k of the table holds, for every start position i, the index of the minimum
+of the block arr[i:i + 2**k]. Level k is built from two blocks of level k - 1.
+A query [lo, hi) picks the largest k with 2**k <= hi - lo and compares the two
+(possibly overlapping) blocks starting at lo and at hi - 2**k; overlap does not
+matter for min and max.
+
+The levels store indices, not values, in compact array('l') columns, so every
+query reports both the extreme value and its position.
+
+Tie-breaking (same as linear_search_min_max): when the extreme value occurs more
+than once in the window, the lowest index is reported.
+
+Time Complexity:
+- Build: O(n log n)
+- Query: O(1)
+
+Space Complexity: O(n log n) indices (two tables: one for minima, one for maxima)
+"""
+
+import os
+import sys
+from array import array
+
+if __name__ == "__main__":
+    # Direct runs start with searching/ on sys.path; add the repository root for the import below
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from searching.static_search import compact_array
+
+
+class SparseTable:
+    """
+    Static array with O(1) range minimum and maximum queries.
+
+    Examples:
+        >>> table = SparseTable([5, 2, 8, 2, 9, 1, 7])
+        >>> table.range_min(0, 5), table.range_max(0, 5)
+        ((2, 1), (9, 4))
+
+        >>> table.range_min_max(2, 7)
+        (1, 9, 5, 4)
+    """
+
+    def __init__(self, arr, track_min=True, track_max=True):
+        """
+        Args:
+            arr (list): Comparable elements (copied; later changes are not seen)
+            track_min (bool): Build the minimum table
+            track_max (bool): Build the maximum table
+        """
+        self._values = compact_array(list(arr))
+        self._min_levels = self._build(_less) if track_min else None
+        self._max_levels = self._build(_greater) if track_max else None
+
+    def _build(self, better):
+        """
+        Levels 1.. of argument indices; level 0 is the identity and not stored.
+
+        better(a, b) is True when value b should replace value a. The left block
+        wins ties, which keeps the lowest index.
+        """
+        values = self._values
+        n = len(values)
+        levels = []
+        previous = range(n)
+        width = 1
+        while 2 * width <= n:
+            left = previous
+            right = previous[width:]
+            level = array('l', [j if better(values[i], values[j]) else i
+                                for i, j in zip(left, right)])
+            levels.append(level)
+            previous = level
+            width *= 2
+        return levels
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def _check(self, lo, hi):
+        if not 0 <= lo < hi <= len(self._values):
+            raise ValueError(f"invalid range [{lo}, {hi}) for {len(self._values)} elements")
+
+    def _query(self, levels, lo, hi, better):
+        k = (hi - lo).bit_length() - 1
+        if k == 0:
+            i, j = lo, hi - 1
+        else:
+            level = levels[k - 1]
+            i, j = level[lo], level[hi - (1 << k)]
+        values = self._values
+        return j if better(values[i], values[j]) else i
+
+    def argmin(self, lo, hi):
+        """
+        Index of the minimum of arr[lo:hi] (lowest index on ties).
+
+        Args:
+            lo (int): Inclusive start
+            hi (int): Exclusive end
+
+        Returns:
+            int: Position of the minimum
+        """
+        if self._min_levels is None:
+            raise ValueError("table was built with track_min=False")
+        self._check(lo, hi)
+        return self._query(self._min_levels, lo, hi, _less)
+
+    def argmax(self, lo, hi):
+        """
+        Index of the maximum of arr[lo:hi] (lowest index on ties).
+
+        Args:
+            lo (int): Inclusive start
+            hi (int): Exclusive end
+
+        Returns:
+            int: Position of the maximum
+        """
+        if self._max_levels is None:
+            raise ValueError("table was built with track_max=False")
+        self._check(lo, hi)
+        return self._query(self._max_levels, lo, hi, _greater)
+
+    def range_min(self, lo, hi):
+        """
+        Minimum of the half-open window arr[lo:hi].
+
+        Args:
+            lo (int): Inclusive start
+            hi (int): Exclusive end
+
+        Returns:
+            tuple: (min_value, min_index)
+        """
+        i = self.argmin(lo, hi)
+        return self._values[i], i
+
+    def range_max(self, lo, hi):
+        """
+        Maximum of the half-open window arr[lo:hi].
+
+        Args:
+            lo (int): Inclusive start
+            hi (int): Exclusive end
+
+        Returns:
+            tuple: (max_value, max_index)
+        """
+        i = self.argmax(lo, hi)
+        return self._values[i], i
+
+    def range_min_max(self, lo, hi):
+        """
+        Same result as linear_search_min_max(arr[lo:hi]), with global indices.
+
+        Args:
+            lo (int): Inclusive start
+            hi (int): Exclusive end
+
+        Returns:
+            tuple: (min_element, max_element, min_index, max_index)
+        """
+        i = self.argmin(lo, hi)
+        j = self.argmax(lo, hi)
+        return self._values[i], self._values[j], i, j
+
+
+def _less(a, b):
+    return b < a
+
+
+def _greater(a, b):
+    return b > a
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.linear_search import linear_search_min_max
+
+    print("=== Sparse Table Range Queries ===\n")
+    readings = [23, 19, 31, 19, 40, 12, 35, 40, 8, 27]
+    table = SparseTable(readings)
+    print(f"Readings: {readings}")
+    for lo, hi in ((0, 4), (2, 8), (4, 10), (3, 4)):
+        print(f"  window [{lo}, {hi}): min {table.range_min(lo, hi)}, "
+              f"max {table.range_max(lo, hi)}")
+
+    print("\n=== Randomised Check Against linear_search_min_max ===")
+    rng = random.Random(0)
+    ok = True
+    for _ in range(200):
+        data = [rng.randint(0, 20) for _ in range(rng.randint(1, 60))]
+        table = SparseTable(data)
+        for _ in range(20):
+            lo = rng.randrange(len(data))
+            hi = rng.randint(lo + 1, len(data))
+            min_val, max_val, min_idx, max_idx = linear_search_min_max(data[lo:hi])
+            ok &= table.range_min_max(lo, hi) == (min_val, max_val, lo + min_idx, lo + max_idx)
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
+
+    print("\n=== Benchmark: 20,000 windows over 200,000 values ===")
+    data = [rng.random() for _ in range(200_000)]
+    windows = []
+    for _ in range(20_000):
+        lo = rng.randrange(len(data))
+        windows.append((lo, min(len(data), lo + rng.randint(1, 5_000))))
+
+    start = time.perf_counter()
+    expected = [linear_search_min_max(data[lo:hi])[0] for lo, hi in windows]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = SparseTable(data, track_max=False)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [table.range_min(lo, hi)[0] for lo, hi in windows]
+    query_time = time.perf_counter() - start
+
+    print(f"  slice + linear_search_min_max: {scan_time:.3f} seconds")
+    print(f"  SparseTable build:             {build_time:.3f} seconds")
+    print(f"  SparseTable queries:           {query_time:.3f} seconds")
+    print(f"  Same results: {results == expected}")
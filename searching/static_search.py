@@ -0,0 +1,348 @@
+"""
+Static Search Layouts (Eytzinger and B-tree order)
+
+A sorted array is easy to binary search but has poor memory locality: the first few
+probes of every search land far apart, and only the last few share a cache line.
+For read-mostly data that is queried millions of times it pays to re-lay the sorted
+values once in an order that matches the search path.
+
+Layouts provided:
+- Eytzinger (BFS) order: the implicit binary search tree is stored level by level,
+  like a binary heap. The root is at index 1 and the children of k are 2k and 2k+1,
+  so the top levels that every search visits sit together at the front of the array.
+- B-tree (S-tree) order: values are grouped into blocks of `block_size` keys that
+  fit in one or two cache lines. Each block is one node of an implicit (B+1)-ary
+  tree, and a search reads one contiguous block per level.
+
+Both indexes store the keys in a compact typed array when possible (array('q') for
+integers, array('d') for floats) plus an array('l') that maps layout slots back to
+positions in the original sorted array. The search methods return those positions
+and mirror binary_search, binary_search_leftmost, binary_search_rightmost and
+binary_search_insertion_point.
+
+Time Complexity:
+- Build: O(n)
+- Eytzinger search: O(log₂ n) probes
+- B-tree search: O(log_{B+1} n) block reads, each a bisection over B keys
+
+Space Complexity: O(n) for the layout and rank arrays
+
+Prerequisites: Input must be sorted in ascending order
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def compact_array(values):
+    """
+    Store values in the most compact container that holds them exactly.
+
+    Args:
+        values (list): Values to store
+
+    Returns:
+        array('q') for 64-bit integers, array('d') for floats, otherwise a list
+    """
+    if values and all(type(v) is int for v in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            return list(values)
+    if values and all(type(v) is float for v in values):
+        return array('d', values)
+    return list(values)
+
+
+class EytzingerIndex:
+    """
+    Sorted values re-laid in Eytzinger (BFS) order for cache-friendly searching.
+
+    Examples:
+        >>> index = EytzingerIndex([1, 3, 3, 5, 7, 9])
+        >>> index.search_leftmost(3), index.search_rightmost(3)
+        (1, 2)
+
+        >>> index.search(4), index.search_insertion_point(4)
+        (-1, 3)
+    """
+
+    def __init__(self, sorted_arr):
+        """
+        Args:
+            sorted_arr (list): Sorted list of comparable elements
+        """
+        n = len(sorted_arr)
+        self._n = n
+
+        # Slot 0 is unused so that the children of k are simply 2k and 2k+1
+        layout = [sorted_arr[0] if n else 0] * (n + 1)
+        ranks = array('l', bytes((n + 1) * array('l').itemsize))
+
+        # In-order walk of the implicit tree assigns the sorted values to slots
+        i = 0
+        k = 1
+        stack = []
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            layout[k] = sorted_arr[i]
+            ranks[k] = i
+            i += 1
+            k = 2 * k + 1
+
+        self._values = compact_array(layout)
+        self._ranks = ranks
+
+    def __len__(self):
+        return self._n
+
+    def _descend(self, target, strict):
+        """
+        Walk from the root to a leaf and return the slot of the lower bound
+        (first value >= target), or of the upper bound (first value > target)
+        when strict is True. Returns 0 if there is no such value.
+        """
+        values = self._values
+        n = self._n
+        k = 1
+        if strict:
+            while k <= n:
+                k = 2 * k + 1 if values[k] <= target else 2 * k
+        else:
+            while k <= n:
+                k = 2 * k + 1 if values[k] < target else 2 * k
+
+        # Undo the final run of right turns plus the last left turn
+        return k >> (~k & (k + 1)).bit_length()
+
+    def search_insertion_point(self, target):
+        """
+        Same as binary_search_insertion_point on the original array.
+
+        Args:
+            target: Element to find insertion point for
+
+        Returns:
+            int: Index where target should be inserted
+        """
+        k = self._descend(target, False)
+        return self._ranks[k] if k else self._n
+
+    def search_leftmost(self, target):
+        """
+        Same as binary_search_leftmost on the original array.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of first occurrence of target, -1 if not found
+        """
+        k = self._descend(target, False)
+        if k and self._values[k] == target:
+            return self._ranks[k]
+        return -1
+
+    def search_rightmost(self, target):
+        """
+        Same as binary_search_rightmost on the original array.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of last occurrence of target, -1 if not found
+        """
+        upper = self._descend(target, True)
+        upper = self._ranks[upper] if upper else self._n
+        lower = self.search_insertion_point(target)
+        return upper - 1 if lower < upper else -1
+
+    def search(self, target):
+        """
+        Same contract as binary_search: an index of target, or -1.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of target (its leftmost occurrence) if found, -1 otherwise
+        """
+        return self.search_leftmost(target)
+
+
+class BTreeIndex:
+    """
+    Sorted values re-laid in implicit B-tree (S-tree) order.
+
+    Examples:
+        >>> index = BTreeIndex(list(range(0, 100, 2)), block_size=4)
+        >>> index.search(42), index.search(43), index.search_insertion_point(43)
+        (21, -1, 22)
+    """
+
+    def __init__(self, sorted_arr, block_size=16):
+        """
+        Args:
+            sorted_arr (list): Sorted list of comparable elements
+            block_size (int): Keys per node; 8-16 keeps a node within a cache line or two
+        """
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+
+        n = len(sorted_arr)
+        B = block_size
+        num_blocks = (n + B - 1) // B
+        self._n = n
+        self._block_size = B
+        self._num_blocks = num_blocks
+
+        # Unused tail slots repeat the largest value and map to rank n; they come
+        # after every real value in key order, so they never win a search
+        pad = sorted_arr[-1] if n else 0
+        layout = [pad] * (num_blocks * B)
+        ranks = array('l', [n]) * (num_blocks * B)
+
+        next_rank = 0
+
+        def build(node):
+            nonlocal next_rank
+            if node >= num_blocks:
+                return
+            for i in range(B):
+                build(node * (B + 1) + i + 1)
+                if next_rank < n:
+                    slot = node * B + i
+                    layout[slot] = sorted_arr[next_rank]
+                    ranks[slot] = next_rank
+                    next_rank += 1
+            build(node * (B + 1) + B + 1)
+
+        build(0)
+
+        self._values = compact_array(layout)
+        self._ranks = ranks
+
+    def __len__(self):
+        return self._n
+
+    def _bound(self, target, strict):
+        """Rank of the first value >= target (> target when strict), or n."""
+        values = self._values
+        ranks = self._ranks
+        B = self._block_size
+        num_blocks = self._num_blocks
+        search = bisect_right if strict else bisect_left
+
+        result = self._n
+        node = 0
+        while node < num_blocks:
+            base = node * B
+            i = search(values, target, base, base + B) - base
+            if i < B:
+                result = ranks[base + i]
+            node = node * (B + 1) + i + 1
+
+        return result
+
+    def search_insertion_point(self, target):
+        """
+        Same as binary_search_insertion_point on the original array.
+
+        Args:
+            target: Element to find insertion point for
+
+        Returns:
+            int: Index where target should be inserted
+        """
+        return self._bound(target, False)
+
+    def search_leftmost(self, target):
+        """
+        Same as binary_search_leftmost on the original array.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of first occurrence of target, -1 if not found
+        """
+        lower = self._bound(target, False)
+        upper = self._bound(target, True)
+        return lower if lower < upper else -1
+
+    def search_rightmost(self, target):
+        """
+        Same as binary_search_rightmost on the original array.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of last occurrence of target, -1 if not found
+        """
+        lower = self._bound(target, False)
+        upper = self._bound(target, True)
+        return upper - 1 if lower < upper else -1
+
+    def search(self, target):
+        """
+        Same contract as binary_search: an index of target, or -1.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of target (its leftmost occurrence) if found, -1 otherwise
+        """
+        return self.search_leftmost(target)
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import os
+    import random
+    import sys
+    import time
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from searching.binary_search import binary_search_insertion_point
+
+    print("=== Eytzinger Layout ===\n")
+    sorted_array = [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    index = EytzingerIndex(sorted_array)
+    print(f"Sorted:    {sorted_array}")
+    print(f"Eytzinger: {list(index._values)[1:]}")
+    for target in (7, 8, 19, 0):
+        print(f"  search({target:2d}) = {index.search(target):2d}, "
+              f"insertion point = {index.search_insertion_point(target)}")
+
+    print("\n=== B-tree Layout (block_size=4) ===\n")
+    index = BTreeIndex(sorted_array, block_size=4)
+    print(f"Blocks: {[list(index._values[i:i + 4]) for i in range(0, len(index._values), 4)]}")
+    for target in (7, 8, 19, 0):
+        print(f"  search({target:2d}) = {index.search(target):2d}, "
+              f"insertion point = {index.search_insertion_point(target)}")
+
+    print("\n=== Benchmark: 200,000 random insertion-point queries ===")
+    rng = random.Random(0)
+    for size in (10_000, 100_000, 1_000_000, 4_000_000):
+        data = sorted(rng.sample(range(size * 8), size))
+        queries = [rng.randrange(size * 8) for _ in range(200_000)]
+        eytzinger = EytzingerIndex(data)
+        btree = BTreeIndex(data)
+        typed = array('q', data)
+
+        timings = []
+        for name, func in (("binary_search", lambda q: binary_search_insertion_point(data, q)),
+                           ("Eytzinger", eytzinger.search_insertion_point),
+                           ("B-tree", btree.search_insertion_point),
+                           ("bisect (typed)", lambda q: bisect_left(typed, q))):
+            start = time.perf_counter()
+            for q in queries:
+                func(q)
+            timings.append(f"{name} {time.perf_counter() - start:.3f}s")
+        print(f"  n={size:>9,}: " + ", ".join(timings))
@@ -0,0 +1,198 @@
+"""
+Bucket Sort Algorithm Implementation
+
+Bucket Sort distributes the elements into a number of buckets that each cover an
+equal slice of the value range, sorts every bucket on its own and concatenates them.
+When the input is spread evenly over a known range (for example normalized scores in
+[0, 1)), every bucket receives only a handful of elements, so the whole sort runs in
+expected linear time. Unlike radix_sort it works directly on floats.
+
+How this implementation works:
+- The number of buckets is chosen from n (about `bucket_size` elements per bucket)
+- The value range is estimated from an evenly spaced sample unless it is given;
+  values outside the estimate are clamped into the first or last bucket
+- Buckets are sorted with the insertion sort kernel, which is fastest on tiny inputs
+- A bucket that ends up much larger than expected (skewed data or a poor range
+  estimate) is bucket sorted again with its own range, and after a few levels of
+  recursion it falls back to merge sort so the worst case stays O(n log n)
+
+Time Complexity:
+- Best/Average Case: O(n) for uniformly distributed input
+- Worst Case: O(n log n) thanks to the skew fallback (O(n²) without it)
+
+Space Complexity: O(n) for the buckets
+
+Stability: Stable - elements keep their relative order inside each bucket
+"""
+
+import math
+import os
+import sys
+
+if __name__ == "__main__":
+    # Running this file as a script puts sorting/ itself on sys.path, not the
+    # repository root that the package imports below are resolved against
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sorting.insertion_sort import insertion_sort
+from sorting.merge_sort import merge_sort
+
+
+def estimate_range(arr, sample_size=256):
+    """
+    Estimate the (low, high) value range of arr from an evenly spaced sample.
+
+    Args:
+        arr (list): List of numbers
+        sample_size (int): Approximate number of elements to inspect
+
+    Returns:
+        tuple: (low, high) of the sampled values
+    """
+    step = max(1, len(arr) // sample_size)
+    sample = arr[::step]
+    # Always include the last element so short inputs are covered exactly
+    sample.append(arr[-1])
+    return min(sample), max(sample)
+
+
+def bucket_sort(arr, low=None, high=None, bucket_size=4, max_depth=3):
+    """
+    Sorts a list of numbers (ints or floats) using bucket sort.
+
+    Args:
+        arr (list): List of numbers to be sorted
+        low: Lower end of the value range (estimated from a sample if omitted)
+        high: Upper end of the value range (estimated from a sample if omitted)
+        bucket_size (int): Expected number of elements per bucket
+        max_depth (int): Recursion levels allowed for skewed buckets before
+                         falling back to merge sort
+
+    Returns:
+        list: A new sorted list (original list is not modified)
+
+    Examples:
+        >>> bucket_sort([0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51])
+        [0.23, 0.25, 0.32, 0.42, 0.47, 0.51, 0.52]
+
+        >>> bucket_sort([5, 2, 8, 1, 9])
+        [1, 2, 5, 8, 9]
+
+        >>> bucket_sort([])
+        []
+    """
+    if bucket_size < 1:
+        raise ValueError("bucket_size must be at least 1")
+    return _bucket_sort(list(arr), low, high, bucket_size, max_depth)
+
+
+def _bucket_sort(arr, low, high, bucket_size, depth_left):
+    """Recursive worker for bucket_sort; may reorder `arr` freely."""
+    n = len(arr)
+    if n <= max(16, bucket_size):
+        return insertion_sort(arr)
+
+    if low is None or high is None:
+        sample_low, sample_high = estimate_range(arr)
+        low = sample_low if low is None else low
+        high = sample_high if high is None else high
+
+    if not high > low:
+        # Degenerate estimate (e.g. mostly equal values): use the exact range
+        low, high = min(arr), max(arr)
+        if low == high:
+            return arr
+
+    num_buckets = n // bucket_size + 1
+    span = high - low
+    scale = num_buckets / span
+    if not (math.isfinite(span) and math.isfinite(scale)):
+        # Infinite, overflowing or subnormal range: bucket indices are meaningless
+        return merge_sort(arr)
+    last = num_buckets - 1
+    buckets = [[] for _ in range(num_buckets)]
+
+    # Distribute the elements, clamping values outside the estimated range
+    # (compared as floats first, so infinities never reach int())
+    for value in arr:
+        position = (value - low) * scale
+        if position < 1:
+            index = 0
+        elif position < last:
+            index = int(position)
+        else:
+            index = last
+        buckets[index].append(value)
+
+    # A bucket this much larger than expected signals skew
+    skew_limit = max(32, 8 * bucket_size)
+
+    result = []
+    for bucket in buckets:
+        if len(bucket) <= 1:
+            result.extend(bucket)
+        elif len(bucket) <= skew_limit:
+            result.extend(insertion_sort(bucket))
+        elif depth_left > 0:
+            result.extend(_bucket_sort(bucket, None, None, bucket_size, depth_left - 1))
+        else:
+            result.extend(merge_sort(bucket))
+
+    return result
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    test_arrays = [
+        [0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51],
+        [64, 34, 25, 12, 22, 11, 90],
+        [1, 2, 3, 4, 5],  # Already sorted
+        [5, 4, 3, 2, 1],  # Reverse sorted
+        [1],              # Single element
+        [],               # Empty array
+        [3, 3, 3, 3],     # All same elements
+        [-2.5, 7.25, 0.0, -11.0, 3.5],  # Negative floats
+    ]
+
+    print("=== Bucket Sort Test Cases ===\n")
+
+    for i, test_arr in enumerate(test_arrays):
+        print(f"Test Case {i + 1}:")
+        print(f"Original: {test_arr}")
+        result = bucket_sort(test_arr)
+        print(f"Sorted:   {result}")
+        print(f"Status:   {'✓ PASS' if result == sorted(test_arr) else '✗ FAIL'}")
+        print()
+
+    print("=== Skewed Input ===")
+    rng = random.Random(1)
+    skewed = [rng.random() ** 8 for _ in range(10_000)] + [1000.0]
+    print(f"Heavily skewed floats plus an outlier sorted correctly: "
+          f"{bucket_sort(skewed) == sorted(skewed)}")
+
+    print("\n=== Randomised Check With Extreme Floats ===")
+    extremes = [float('inf'), float('-inf'), 5e-324, -5e-324, 0.0, 1e308, -1e308]
+    ok = True
+    for _ in range(300):
+        size = rng.randint(0, 200)
+        data = [rng.choice(extremes) if rng.random() < 0.2 else rng.uniform(-1e308, 1e308)
+                for _ in range(size)]
+        ok &= bucket_sort(data) == sorted(data)
+        subnormal = [rng.choice((0.0, 5e-324, 1e-323)) for _ in range(size)]
+        ok &= bucket_sort(subnormal) == sorted(subnormal)
+    ok &= bucket_sort([0.0, 5e-324] * 20) == sorted([0.0, 5e-324] * 20)
+    ok &= bucket_sort([-1e308, 1e308] * 20) == sorted([-1e308, 1e308] * 20)
+    print(f"  inf, subnormal and ±1e308 inputs: {'✓ PASS' if ok else '✗ FAIL'}")
+
+    print("\n=== Performance on Uniform Floats in [0, 1) ===")
+    for size in (10_000, 100_000):
+        data = [rng.random() for _ in range(size)]
+        for name, algorithm in (("Bucket Sort", lambda a: bucket_sort(a, 0.0, 1.0)),
+                                ("Merge Sort", merge_sort)):
+            start = time.perf_counter()
+            algorithm(data)
+            elapsed = time.perf_counter() - start
+            print(f"  n={size:>7}: {name:12}: {elapsed:.4f} seconds")
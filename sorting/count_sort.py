@@ -21,6 +21,9 @@ Space Complexity: O(k) for the counting array, plus O(n) for output array = O(n
 Stability: Stable - maintains relative order of equal elements
 """
 
+from array import array
+
+
 def count_sort(arr):
     """
     Sorts an array of non-negative integers using counting sort.
@@ -230,6 +233,48 @@ def count_sort_with_objects(objects, key_func):
     return output
 
 
+def count_sort_argsort(arr):
+    """
+    Stable counting sort that returns the sorting permutation instead of moved values.
+    
+    Args:
+        arr (list): List of non-negative integers (not modified)
+        
+    Returns:
+        array: array('l') perm where arr[perm[0]] <= arr[perm[1]] <= ...;
+               equal elements keep their original relative order
+        
+    Examples:
+        >>> list(count_sort_argsort([4, 2, 2, 8]))
+        [1, 2, 0, 3]
+    """
+    n = len(arr)
+    perm = array('l', range(n))
+    if n <= 1:
+        return perm
+    
+    if any(x < 0 for x in arr):
+        raise ValueError("Count sort only works with non-negative integers")
+    
+    min_val = min(arr)
+    range_val = max(arr) - min_val + 1
+    
+    count = [0] * range_val
+    for num in arr:
+        count[num - min_val] += 1
+    
+    for i in range(1, range_val):
+        count[i] += count[i - 1]
+    
+    # Place indices from right to left to maintain stability
+    for i in range(n - 1, -1, -1):
+        slot = arr[i] - min_val
+        count[slot] -= 1
+        perm[count[slot]] = i
+    
+    return perm
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     # Test cases
@@ -293,4 +338,12 @@ if __name__ == "__main__":
     # Verbose example for educational purposes
     print("\n=== Verbose Example ===")
     sample_array = [4, 2, 2, 8, 3, 3, 1]
-    count_sort_verbose(sample_array)
\ No newline at end of file
+    count_sort_verbose(sample_array)
+    
+    # Argsort: the permutation that sorts the array
+    print("\n=== Count Sort Argsort ===")
+    sample_array = [170, 45, 75, 90, 2, 45]
+    perm = count_sort_argsort(sample_array)
+    print(f"Array:       {sample_array}")
+    print(f"Permutation: {list(perm)}")
+    print(f"Reordered:   {[sample_array[i] for i in perm]}")
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""
+Fenwick Tree Histogram (Dynamic Counting for Rank and Order Statistics)
+
+count_sort builds a cumulative count array, uses it once to place the elements and
+throws it away. A Fenwick tree (binary indexed tree) keeps the same cumulative
+counts in a form that can also be updated: each slot i stores the count of a block
+of keys ending at i whose length is the lowest set bit of i. Both changing a count
+and summing a prefix touch O(log U) slots for U possible keys.
+
+FenwickHistogram holds counts for the integer keys in [low, high) and answers, on a
+live stream of insertions and deletions, without re-sorting:
+- rank(key): how many elements are smaller than key
+- count_range(lo, hi): how many elements lie in [lo, hi)
+- select(k): the k-th smallest element (0-based), found by binary lifting
+  down the implicit tree instead of binary searching over rank
+- quantile / percentile: select at the nearest rank
+
+The tree is an array('q'), so it takes 8 bytes per possible key.
+
+Time Complexity:
+- add / rank / count_range / select: O(log U)
+- Build from keys: O(n + U)
+
+Space Complexity: O(U) where U = high - low
+"""
+
+from array import array
+from math import ceil
+
+
+class FenwickHistogram:
+    """
+    Updatable histogram of integer keys with rank and select queries.
+
+    Examples:
+        >>> hist = FenwickHistogram(0, 100)
+        >>> for score in [70, 85, 85, 92, 60]:
+        ...     hist.add(score)
+        >>> hist.rank(85), hist.count_range(80, 90), hist.select(2)
+        (2, 2, 85)
+
+        >>> hist.add(85, -1)
+        >>> hist.percentile(50)
+        70
+    """
+
+    def __init__(self, low, high):
+        """
+        Args:
+            low (int): Smallest key that can be stored
+            high (int): One past the largest key that can be stored
+        """
+        if high <= low:
+            raise ValueError("high must be greater than low")
+        self.low = low
+        self.high = high
+        self._size = high - low
+        self._tree = array('q', bytes(8 * (self._size + 1)))  # 1-based; slot 0 unused
+        self._top = 1 << (self._size.bit_length() - 1)
+        self._total = 0
+
+    @classmethod
+    def from_keys(cls, keys, low=None, high=None):
+        """
+        Build a histogram from existing keys in O(n + U).
+
+        Args:
+            keys (list): Integer keys
+            low (int): Smallest storable key (defaults to min(keys))
+            high (int): One past the largest storable key (defaults to max(keys) + 1)
+
+        Returns:
+            FenwickHistogram: Histogram holding every key once per occurrence
+        """
+        keys = list(keys)
+        if low is None:
+            low = min(keys) if keys else 0
+        if high is None:
+            high = max(keys) + 1 if keys else low + 1
+
+        hist = cls(low, high)
+        tree = hist._tree
+        for key in keys:
+            if not low <= key < high:
+                raise ValueError(f"key {key} outside [{low}, {high})")
+            tree[key - low + 1] += 1
+
+        # Push every slot's count into its parent once (linear-time construction)
+        size = hist._size
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        hist._total = len(keys)
+        return hist
+
+    def __len__(self):
+        return self._total
+
+    def _prefix(self, end):
+        """Number of elements with key offset < end (end in 0..size)."""
+        tree = self._tree
+        total = 0
+        while end > 0:
+            total += tree[end]
+            end &= end - 1
+        return total
+
+    def add(self, key, delta=1):
+        """
+        Add delta occurrences of key (a negative delta removes them).
+
+        Args:
+            key (int): Key in [low, high)
+            delta (int): Change in the key's count
+        """
+        if not self.low <= key < self.high:
+            raise ValueError(f"key {key} outside [{self.low}, {self.high})")
+        if delta < 0 and self.count(key) < -delta:
+            raise ValueError(f"cannot remove {-delta} occurrences of {key}")
+
+        tree = self._tree
+        size = self._size
+        i = key - self.low + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+        self._total += delta
+
+    def remove(self, key):
+        """Remove one occurrence of key (ValueError if it is not present)."""
+        self.add(key, -1)
+
+    def count(self, key):
+        """
+        Number of occurrences of key.
+
+        Args:
+            key (int): Key to count
+
+        Returns:
+            int: Its count (0 for keys outside the range)
+        """
+        if not self.low <= key < self.high:
+            return 0
+        offset = key - self.low
+        return self._prefix(offset + 1) - self._prefix(offset)
+
+    def rank(self, key):
+        """
+        Number of elements strictly smaller than key.
+
+        Args:
+            key (int): Any integer (need not be in the range)
+
+        Returns:
+            int: Count of stored elements < key
+        """
+        if key <= self.low:
+            return 0
+        if key >= self.high:
+            return self._total
+        return self._prefix(key - self.low)
+
+    def count_range(self, lo, hi):
+        """
+        Number of elements in the half-open interval [lo, hi).
+
+        Args:
+            lo (int): Inclusive lower bound
+            hi (int): Exclusive upper bound
+
+        Returns:
+            int: Count of stored elements with lo <= key < hi
+        """
+        if hi <= lo:
+            return 0
+        return self.rank(hi) - self.rank(lo)
+
+    def select(self, k):
+        """
+        The k-th smallest element (0-based), by binary lifting.
+
+        Starting from the largest power of two, each step either skips a whole
+        block (when it holds at most k elements) or descends into it, so the
+        answer is found in one O(log U) pass rather than a binary search over rank.
+
+        Args:
+            k (int): Rank of the element, 0 <= k < len(self)
+
+        Returns:
+            int: The key at sorted position k
+        """
+        if not 0 <= k < self._total:
+            raise IndexError("select index out of range")
+
+        tree = self._tree
+        size = self._size
+        position = 0
+        step = self._top
+        while step:
+            following = position + step
+            if following <= size and tree[following] <= k:
+                position = following
+                k -= tree[following]
+            step >>= 1
+        return self.low + position
+
+    def quantile(self, q):
+        """
+        Nearest-rank quantile.
+
+        Args:
+            q (float): Fraction in [0, 1] (0.5 is the median)
+
+        Returns:
+            int: The smallest key with at least q * len(self) elements at or below it
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        if self._total == 0:
+            raise ValueError("quantile of an empty histogram")
+        return self.select(min(self._total - 1, max(0, ceil(q * self._total) - 1)))
+
+    def percentile(self, p):
+        """
+        Nearest-rank percentile.
+
+        Args:
+            p (float): Percentage in [0, 100] (e.g. 95 for p95)
+
+        Returns:
+            int: The key at that percentile
+        """
+        return self.quantile(p / 100)
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=== Live Latency Histogram ===\n")
+    latencies = FenwickHistogram(0, 10_000)  # milliseconds
+    for ms in [120, 95, 300, 95, 2_000, 150, 110, 95, 480, 130]:
+        latencies.add(ms)
+    print(f"Samples: {len(latencies)}")
+    print(f"p50 = {latencies.percentile(50)} ms, p90 = {latencies.percentile(90)} ms")
+    print(f"Requests under 150 ms: {latencies.rank(150)}")
+    print(f"Requests in [100, 500): {latencies.count_range(100, 500)}")
+    latencies.remove(2_000)
+    print(f"After dropping the 2000 ms outlier, p90 = {latencies.percentile(90)} ms")
+
+    print("\n=== Randomised Check Against a Sorted List ===")
+    rng = random.Random(0)
+    ok = True
+    for _ in range(200):
+        low = rng.randint(-20, 5)
+        high = low + rng.randint(1, 40)
+        keys = [rng.randrange(low, high) for _ in range(rng.randint(0, 50))]
+        hist = FenwickHistogram.from_keys(keys, low, high)
+        for _ in range(20):
+            if keys and rng.random() < 0.3:
+                key = rng.choice(keys)
+                keys.remove(key)
+                hist.remove(key)
+            else:
+                key = rng.randrange(low, high)
+                keys.append(key)
+                hist.add(key)
+        ordered = sorted(keys)
+        ok &= all(hist.select(k) == ordered[k] for k in range(len(ordered)))
+        for key in range(low - 2, high + 2):
+            ok &= hist.rank(key) == sum(x < key for x in keys)
+            ok &= hist.count(key) == keys.count(key)
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
+
+    print("\n=== Benchmark: p99 after every 1,000 of 200,000 streamed values ===")
+    stream = [rng.randrange(100_000) for _ in range(200_000)]
+
+    start = time.perf_counter()
+    seen = []
+    resorted = []
+    for i, value in enumerate(stream, 1):
+        seen.append(value)
+        if i % 1_000 == 0:
+            resorted.append(sorted(seen)[ceil(0.99 * i) - 1])
+    sort_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hist = FenwickHistogram(0, 100_000)
+    live = []
+    for i, value in enumerate(stream, 1):
+        hist.add(value)
+        if i % 1_000 == 0:
+            live.append(hist.percentile(99))
+    fenwick_time = time.perf_counter() - start
+
+    print(f"  re-sorting each time: {sort_time:.3f} seconds")
+    print(f"  FenwickHistogram:     {fenwick_time:.3f} seconds")
+    print(f"  Same percentiles: {live == resorted}")
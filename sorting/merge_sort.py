@@ -21,6 +21,10 @@ Space Complexity: O(n) - requires additional space for temporary arrays
 Stability: Stable - maintains relative order of equal elements
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+
+
 def merge_sort(arr):
     """
     Sorts an array using the merge sort algorithm.
@@ -197,6 +201,172 @@ def merge_sort_verbose(arr, depth=0, left=None, right=None):
     return arr
 
 
+def merge_sort_argsort(arr):
+    """
+    Stable merge sort that returns the sorting permutation instead of moved values.
+    
+    Only machine-sized indices are moved during the merges; the elements themselves
+    are just compared. Use apply_permutation (sorting/permutation.py) to reorder
+    this or any parallel sequence afterwards.
+    
+    Args:
+        arr (list): List of comparable elements (not modified)
+        
+    Returns:
+        array: array('l') perm where arr[perm[0]] <= arr[perm[1]] <= ...;
+               equal elements keep their original relative order
+        
+    Examples:
+        >>> list(merge_sort_argsort([30, 10, 20, 10]))
+        [1, 3, 2, 0]
+    """
+    n = len(arr)
+    perm = array('l', range(n))
+    if n <= 1:
+        return perm
+    
+    buffer = array('l', perm)
+    width = 1
+    
+    # Bottom-up merging of runs of `width` indices from perm into buffer
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j, k = left, mid, left
+            
+            while i < mid and j < right:
+                # Take from the right run only if strictly smaller (stability)
+                if arr[perm[j]] < arr[perm[i]]:
+                    buffer[k] = perm[j]
+                    j += 1
+                else:
+                    buffer[k] = perm[i]
+                    i += 1
+                k += 1
+            
+            if i < mid:
+                buffer[k:right] = perm[i:mid]
+            elif j < right:
+                buffer[k:right] = perm[j:right]
+        
+        perm, buffer = buffer, perm
+        width *= 2
+    
+    return perm
+
+
+def _gallop_left(arr, target, lo, hi):
+    """
+    bisect_left(arr, target, lo, hi), found by galloping forward from lo.
+    
+    Probes lo, lo+1, lo+3, lo+7, ... before bisecting the last gap, so the cost is
+    O(log d) when the answer is d positions past lo.
+    """
+    last = lo
+    offset = 1
+    probe = lo
+    while probe < hi and arr[probe] < target:
+        last = probe + 1
+        offset *= 2
+        probe = lo + offset - 1
+    return bisect_left(arr, target, last, min(probe, hi))
+
+
+def _gallop_right_backward(arr, target, hi):
+    """
+    bisect_right(arr, target, 0, hi), found by galloping backward from hi.
+    
+    Cost is O(log d) when the answer is d positions before hi.
+    """
+    last = hi
+    offset = 1
+    while offset <= hi and target < arr[hi - offset]:
+        last = hi - offset
+        offset *= 2
+    return bisect_right(arr, target, max(hi - offset + 1, 0), last)
+
+
+def merge_sort_apply_batch(sorted_arr, inserts=(), deletes=(), updates=()):
+    """
+    Apply a small batch of changes to a sorted array without re-sorting it.
+    
+    The batch is sorted on its own with merge_sort, then spliced into the array:
+    deletions are located by galloping forward and removed in a single compaction
+    pass, and insertions are merged in from the back by galloping backward, moving
+    each block of existing elements once with a slice copy. For a batch of b
+    changes the cost is O(b log b + b log n + moved elements) instead of the
+    O(n log n) of re-running merge_sort on everything.
+    
+    Args:
+        sorted_arr (list): Sorted list (or array.array), modified in place
+        inserts: Values to insert (placed after existing equal values)
+        deletes: Values to remove, one occurrence each
+        updates: (old_value, new_value) pairs; each is a delete plus an insert
+        
+    Returns:
+        list: sorted_arr itself, updated
+        
+    Raises:
+        ValueError: If a value to delete or update is not present
+                    (sorted_arr is left unchanged in that case)
+        
+    Examples:
+        >>> merge_sort_apply_batch([1, 3, 5, 7], inserts=[4, 0], deletes=[5])
+        [0, 1, 3, 4, 7]
+        
+        >>> merge_sort_apply_batch([1, 3, 5, 7], updates=[(3, 8)])
+        [1, 5, 7, 8]
+    """
+    arr = sorted_arr
+    deletes = list(deletes)
+    inserts = list(inserts)
+    for old_value, new_value in updates:
+        deletes.append(old_value)
+        inserts.append(new_value)
+    
+    # Locate every deletion before touching the array, so a miss changes nothing
+    n = len(arr)
+    positions = []
+    start = 0
+    for value in merge_sort(deletes):
+        pos = _gallop_left(arr, value, start, n)
+        if pos == n or arr[pos] != value:
+            raise ValueError(f"{value!r} is not in the sorted array")
+        positions.append(pos)
+        start = pos + 1
+    
+    # Compact: shift each surviving block left over the deleted slots
+    if positions:
+        write = positions[0]
+        for k, pos in enumerate(positions):
+            next_pos = positions[k + 1] if k + 1 < len(positions) else n
+            block = next_pos - pos - 1
+            if block:
+                arr[write:write + block] = arr[pos + 1:next_pos]
+                write += block
+        del arr[write:]
+    
+    # Merge the sorted inserts in from the back into room made at the end
+    if inserts:
+        batch = merge_sort(inserts)
+        hi = len(arr)
+        arr.extend(batch)
+        write = len(arr)
+        
+        for value in reversed(batch):
+            pos = _gallop_right_backward(arr, value, hi)
+            block = hi - pos
+            if block:
+                arr[write - block:write] = arr[pos:hi]
+                write -= block
+            write -= 1
+            arr[write] = value
+            hi = pos
+    
+    return arr
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     # Test cases
@@ -222,4 +392,36 @@ if __name__ == "__main__":
     # Verbose example for educational purposes
     print("\n=== Verbose Example ===")
     sample_array = [64, 34, 25, 12, 22, 11]
-    merge_sort_verbose(sample_array)
\ No newline at end of file
+    merge_sort_verbose(sample_array)
+    
+    # Argsort: the permutation that sorts the array
+    print("\n=== Merge Sort Argsort ===")
+    sample_array = [170, 45, 75, 90, 2, 45]
+    perm = merge_sort_argsort(sample_array)
+    print(f"Array:       {sample_array}")
+    print(f"Permutation: {list(perm)}")
+    print(f"Reordered:   {[sample_array[i] for i in perm]}")
+    
+    # Incremental update of a large sorted array
+    print("\n=== Batch Update of a Sorted Array ===")
+    import random
+    import time
+    
+    big_array = sorted(random.randint(0, 10**9) for _ in range(200_000))
+    inserts = [random.randint(0, 10**9) for _ in range(300)]
+    deletes = random.sample(big_array, 300)
+    
+    start = time.perf_counter()
+    rebuilt = [x for x in big_array]
+    for value in deletes:
+        rebuilt.remove(value)
+    rebuilt = merge_sort(rebuilt + inserts)
+    full_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    merge_sort_apply_batch(big_array, inserts=inserts, deletes=deletes)
+    batch_time = time.perf_counter() - start
+    
+    print(f"Results match: {big_array == rebuilt}")
+    print(f"  merge_sort from scratch: {full_time:.3f} seconds")
+    print(f"  merge_sort_apply_batch:  {batch_time:.3f} seconds")
\ No newline at end of file
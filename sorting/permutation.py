@@ -0,0 +1,121 @@
+"""
+Permutation Helpers for Argsort Results
+
+The *_argsort functions (merge_sort_argsort, quick_sort_argsort, radix_sort_argsort,
+count_sort_argsort) return an index permutation instead of moved values:
+perm[i] is the index of the element that belongs at position i of the sorted output.
+The helpers here use such a permutation to reorder parallel columns.
+
+apply_permutation reorders a mutable sequence in place by following the cycles of the
+permutation: each element is moved exactly once and only one element is held in a
+temporary at any time. A bytearray of n flags marks finished positions, so the extra
+memory is n bytes instead of a full copy of the (possibly large) objects.
+
+Time Complexity: O(n) per sequence
+Space Complexity: O(n) bytes for the visited flags
+"""
+
+from array import array
+
+
+def apply_permutation(seq, perm):
+    """
+    Reorder seq in place so that seq[i] becomes the old seq[perm[i]].
+
+    Args:
+        seq: Mutable sequence (list, array.array, bytearray, ...) of length n
+        perm: Permutation of range(n), e.g. an argsort result
+
+    Returns:
+        The same sequence object, reordered
+
+    Examples:
+        >>> apply_permutation(['b', 'c', 'a'], [2, 0, 1])
+        ['a', 'b', 'c']
+    """
+    n = len(seq)
+    if len(perm) != n:
+        raise ValueError("Permutation and sequence must have the same length")
+
+    done = bytearray(n)
+
+    for start in range(n):
+        if done[start]:
+            continue
+
+        # Walk the cycle that starts here, pulling each element into place
+        held = seq[start]
+        current = start
+        while True:
+            done[current] = 1
+            source = perm[current]
+            if source == start:
+                seq[current] = held
+                break
+            if done[source]:
+                raise ValueError("perm is not a permutation")
+            seq[current] = seq[source]
+            current = source
+
+    return seq
+
+
+def apply_permutation_many(perm, *sequences):
+    """
+    Reorder several parallel sequences in place with the same permutation.
+
+    Args:
+        perm: Permutation of range(n), e.g. an argsort of a key column
+        *sequences: Mutable sequences of length n
+
+    Returns:
+        tuple: The reordered sequences
+
+    Examples:
+        >>> names, ages = ['bob', 'amy', 'cat'], [30, 25, 35]
+        >>> apply_permutation_many([1, 0, 2], names, ages)
+        (['amy', 'bob', 'cat'], [25, 30, 35])
+    """
+    for seq in sequences:
+        apply_permutation(seq, perm)
+    return sequences
+
+
+def invert_permutation(perm):
+    """
+    Compute the inverse permutation (the rank of every original element).
+
+    Args:
+        perm: Permutation of range(n)
+
+    Returns:
+        array: array('l') inv with inv[perm[i]] == i
+    """
+    inverse = array('l', bytes(len(perm) * array('l').itemsize))
+    for i, source in enumerate(perm):
+        inverse[source] = i
+    return inverse
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from sorting.merge_sort import merge_sort_argsort
+
+    print("=== Reorder Parallel Columns By One Key ===\n")
+    names = ["Alice", "Bob", "Charlie", "Diana", "Eve"]
+    ages = [23, 19, 21, 19, 25]
+    cities = ["Oslo", "Lima", "Rome", "Kyiv", "Pune"]
+
+    perm = merge_sort_argsort(ages)
+    print(f"Key column (ages): {ages}")
+    print(f"Argsort:           {list(perm)}")
+    print(f"Inverse (ranks):   {list(invert_permutation(perm))}")
+
+    apply_permutation_many(perm, names, ages, cities)
+    print(f"Names:  {names}")
+    print(f"Ages:   {ages}")
+    print(f"Cities: {cities}")
@@ -0,0 +1,338 @@
+"""
+Streaming Quantile Sketch (KLL)
+
+Computing p50/p95/p99 with merge_sort or quick_sort needs every value in memory at
+once. A KLL sketch (Karnin, Lang and Liberty) keeps a small, bounded sample instead
+and still answers any quantile with a provable rank error.
+
+The sketch is a stack of compactors. New values go into level 0. When a level is
+full it is sorted and every other element, starting at a random offset of 0 or 1,
+is promoted to the next level, where each surviving element stands for twice as
+many original values. Level h therefore holds items of weight 2**h. Lower levels
+get geometrically smaller capacities (factor 2/3 per level below the top), so the
+total number of retained items stays O(k) while the rank error is about 1/k of the
+stream length, independent of how many values went in.
+
+Properties:
+- Bounded memory: configured by k (or derived from a target error epsilon)
+- Mergeable: sketches built on different workers or shards can be merged, and
+  the result has the same error guarantee as one sketch over all the data
+- Exact mode: until the first compaction nothing has been discarded, and queries
+  are answered exactly with quick_select instead of a full sort
+
+Time Complexity:
+- update: O(1) amortized (O(log n) including the occasional compaction sorts)
+- quantile / rank: O(k log k) the first time after an update, then O(log k)
+
+Space Complexity: O(k) retained items
+"""
+
+import os
+import random
+import sys
+from bisect import bisect_left
+from itertools import accumulate
+from math import ceil
+
+if __name__ == "__main__":
+    # When executed as a script, resolve the sorting package from the repository root
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sorting.quick_sort import quick_select
+
+
+def exact_quantile(arr, q, seed=None):
+    """
+    Nearest-rank quantile of an in-memory list, in expected O(n) via quick_select.
+
+    Args:
+        arr (list): Comparable values
+        q (float): Fraction in [0, 1]
+        seed: Optional seed for quick_select's pivots
+
+    Returns:
+        The smallest value with at least q * len(arr) values at or below it
+
+    Examples:
+        >>> exact_quantile([15, 20, 35, 40, 50], 0.4)
+        20
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("q must be in [0, 1]")
+    if not arr:
+        raise ValueError("quantile of an empty sequence")
+    n = len(arr)
+    return quick_select(arr, min(n - 1, max(0, ceil(q * n) - 1)), seed)
+
+
+class KLLSketch:
+    """
+    Mergeable streaming quantile sketch with bounded memory.
+
+    Examples:
+        >>> sketch = KLLSketch(k=200, seed=1)
+        >>> sketch.update_many(range(1, 101))
+        >>> sketch.is_exact, sketch.quantile(0.5), sketch.rank(30)
+        (True, 50, 29)
+    """
+
+    # Capacity shrink factor for each level below the top one
+    _DECAY = 2 / 3
+
+    def __init__(self, k=200, epsilon=None, seed=None):
+        """
+        Args:
+            k (int): Size parameter; retained items are about 3k and the normalized
+                     rank error is about 1.7 / k
+            epsilon (float): Target normalized rank error; when given, k is derived
+                             from it (k = ceil(1.7 / epsilon))
+            seed: Optional seed for the random compaction offsets
+        """
+        if epsilon is not None:
+            if not 0 < epsilon < 1:
+                raise ValueError("epsilon must be in (0, 1)")
+            k = ceil(1.7 / epsilon)
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self.k = k
+        self._rng = random.Random(seed)
+        self._levels = [[]]
+        self._n = 0
+        self._retained = 0
+        self._max_retained = self._capacity(0)
+        self._min = self._max = None
+        self._sorted = None  # cached (items, cumulative weights)
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return int(ceil(self.k * self._DECAY ** depth)) + 1
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def is_exact(self):
+        """True while no values have been compacted away (queries are exact)."""
+        return len(self._levels) == 1
+
+    @property
+    def retained(self):
+        """Number of items currently stored (the sketch's memory in items)."""
+        return self._retained
+
+    def update(self, value):
+        """
+        Add one value to the sketch.
+
+        Args:
+            value: Comparable value
+        """
+        if self._n == 0:
+            self._min = self._max = value
+        elif value < self._min:
+            self._min = value
+        elif value > self._max:
+            self._max = value
+
+        self._levels[0].append(value)
+        self._n += 1
+        self._retained += 1
+        self._sorted = None
+        if self._retained >= self._max_retained:
+            self._compress()
+
+    def update_many(self, values):
+        """Add every value of an iterable."""
+        for value in values:
+            self.update(value)
+
+    def _grow(self):
+        self._levels.append([])
+        self._max_retained = sum(self._capacity(h) for h in range(len(self._levels)))
+
+    def _compress(self):
+        """Compact full levels until the sketch is back under its size limit."""
+        while self._retained >= self._max_retained:
+            for h, items in enumerate(self._levels):
+                if len(items) >= self._capacity(h):
+                    if h + 1 == len(self._levels):
+                        self._grow()
+                    items.sort()
+                    # An odd leftover (the smallest item) stays at this level
+                    keep = len(items) % 2
+                    promoted = items[keep + self._rng.getrandbits(1)::2]
+                    self._levels[h + 1].extend(promoted)
+                    del items[keep:]
+                    self._retained = sum(len(level) for level in self._levels)
+                    break
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one (e.g. from another worker or shard).
+
+        Args:
+            other (KLLSketch): Sketch to merge; it is not modified
+        """
+        if other._n == 0:
+            return
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for h, items in enumerate(other._levels):
+            self._levels[h].extend(items)
+
+        if self._n == 0:
+            self._min, self._max = other._min, other._max
+        else:
+            if other._min < self._min:
+                self._min = other._min
+            if other._max > self._max:
+                self._max = other._max
+        self._n += other._n
+        self._retained = sum(len(level) for level in self._levels)
+        self._sorted = None
+        if self._retained >= self._max_retained:
+            self._compress()
+
+    def _weighted(self):
+        """Sorted retained items with cumulative weights (cached until the next update)."""
+        if self._sorted is None:
+            pairs = sorted((item, 1 << h) for h, items in enumerate(self._levels)
+                           for item in items)
+            items = [item for item, _ in pairs]
+            cumulative = list(accumulate(weight for _, weight in pairs))
+            self._sorted = (items, cumulative)
+        return self._sorted
+
+    def quantile(self, q):
+        """
+        Approximate nearest-rank quantile (exact while is_exact is True).
+
+        Args:
+            q (float): Fraction in [0, 1] (0.5 is the median, 0.99 is p99)
+
+        Returns:
+            A retained value whose rank is within about n / k of q * n
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        if self._n == 0:
+            raise ValueError("quantile of an empty sketch")
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+
+        target = max(1, ceil(q * self._n))
+        if self.is_exact:
+            # The pivots do not affect the answer; a fixed seed keeps queries from
+            # consuming the compaction RNG, so results stay reproducible per seed
+            return quick_select(self._levels[0], target - 1, seed=0)
+
+        items, cumulative = self._weighted()
+        return items[min(len(items) - 1, bisect_left(cumulative, target))]
+
+    def quantiles(self, qs):
+        """Quantiles for several fractions at once (sharing one weighted sort)."""
+        return [self.quantile(q) for q in qs]
+
+    def percentile(self, p):
+        """
+        Approximate nearest-rank percentile.
+
+        Args:
+            p (float): Percentage in [0, 100] (e.g. 95 for p95)
+
+        Returns:
+            The value at that percentile
+        """
+        return self.quantile(p / 100)
+
+    def rank(self, value):
+        """
+        Approximate number of values strictly smaller than value.
+
+        Args:
+            value: Any comparable value
+
+        Returns:
+            int: Estimated count of values < value (exact while is_exact is True)
+        """
+        items, cumulative = self._weighted()
+        i = bisect_left(items, value)
+        return cumulative[i - 1] if i else 0
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import time
+
+    from sorting.merge_sort import merge_sort
+
+    print("=== Exact Mode (small inputs use quick_select) ===\n")
+    small = KLLSketch(k=200, seed=0)
+    latencies = [120, 95, 300, 95, 2_000, 150, 110, 95, 480, 130]
+    small.update_many(latencies)
+    print(f"Values: {latencies}")
+    print(f"is_exact: {small.is_exact}, p50 = {small.percentile(50)}, "
+          f"p90 = {small.percentile(90)}")
+    print(f"exact_quantile(values, 0.9) = {exact_quantile(latencies, 0.9)}")
+
+    print("\n=== Accuracy vs Memory (1,000,000 values) ===\n")
+    rng = random.Random(42)
+    data = [rng.lognormvariate(0, 1) for _ in range(1_000_000)]
+    qs = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+    start = time.perf_counter()
+    ordered = sorted(data)
+    sort_time = time.perf_counter() - start
+    n = len(ordered)
+
+    def rank_error(value, q):
+        """Normalized distance between the true rank of value and q * n."""
+        lo = bisect_left(ordered, value)
+        hi = lo
+        while hi < n and ordered[hi] == value:
+            hi += 1
+        target = max(1, ceil(q * n))
+        if lo < target <= hi:
+            return 0.0
+        return min(abs(lo + 1 - target), abs(hi - target)) / n
+
+    print(f"  Exact: sorted() in {sort_time:.2f}s holding {n:,} values\n")
+    print(f"  {'k':>5} {'retained':>9} {'memory':>8} {'max rank error':>15} {'time':>7}")
+    for k in (50, 100, 200, 400, 800):
+        start = time.perf_counter()
+        sketch = KLLSketch(k=k, seed=k)
+        sketch.update_many(data)
+        answers = sketch.quantiles(qs)
+        elapsed = time.perf_counter() - start
+        worst = max(rank_error(value, q) for value, q in zip(answers, qs))
+        print(f"  {k:>5} {sketch.retained:>9,} {sketch.retained / n:>7.3%} "
+              f"{worst:>15.4%} {elapsed:>6.2f}s")
+
+    print("\n=== Merging Shards ===\n")
+    shards = [KLLSketch(k=200, seed=i) for i in range(4)]
+    for i, value in enumerate(data):
+        shards[i % 4].update(value)
+    merged = KLLSketch(k=200, seed=99)
+    for shard in shards:
+        merged.merge(shard)
+    answers = merged.quantiles(qs)
+    worst = max(rank_error(value, q) for value, q in zip(answers, qs))
+    print(f"  4 shards merged: {len(merged):,} values, {merged.retained:,} retained, "
+          f"max rank error {worst:.4%}")
+    print(f"  p50 = {merged.percentile(50):.4f} (exact {ordered[n // 2 - 1]:.4f}), "
+          f"p99 = {merged.percentile(99):.4f} (exact {ordered[ceil(0.99 * n) - 1]:.4f})")
+
+    print("\n=== Randomised Check of Exact Mode Against merge_sort ===")
+    ok = True
+    for _ in range(200):
+        values = [rng.randint(0, 50) for _ in range(rng.randint(1, 150))]
+        sketch = KLLSketch(k=200, seed=1)
+        sketch.update_many(values)
+        reference = merge_sort(values)
+        for q in (0, 0.1, 0.5, 0.9, 0.99, 1):
+            ok &= sketch.quantile(q) == reference[min(len(values) - 1,
+                                                      max(0, ceil(q * len(values)) - 1))]
+        ok &= sketch.rank(25) == sum(v < 25 for v in values)
+    print(f"  {'✓ PASS' if ok else '✗ FAIL'}")
@@ -21,6 +21,10 @@ Space Complexity: O(log n) - due to recursive call stack (O(n) in worst case)
 Stability: Not stable - may change relative order of equal elements
 """
 
+import random
+from array import array
+
+
 def quick_sort(arr):
     """
     Sorts an array using the quick sort algorithm.
@@ -235,6 +239,211 @@ def partition_verbose(arr, low, high, depth):
     return i + 1
 
 
+def quick_sort_argsort(arr, seed=None):
+    """
+    Quick sort that returns the sorting permutation instead of moved values.
+    
+    Partitions an index array with the three-way scheme of partition_three_way,
+    comparing arr[index] values around a randomly chosen pivot. Random pivots keep
+    already-sorted input at expected O(n log n), and grouping the indices of
+    elements equal to the pivot keeps inputs with few distinct keys from degrading
+    to O(n²). Recursion always descends into the smaller partition, so the stack
+    depth stays O(log n).
+    
+    Args:
+        arr (list): List of comparable elements (not modified)
+        seed: Optional seed for the random pivot choice
+        
+    Returns:
+        array: array('l') perm where arr[perm[0]] <= arr[perm[1]] <= ...
+               (not stable: equal elements may appear in any order)
+        
+    Examples:
+        >>> list(quick_sort_argsort([30, 10, 20]))
+        [1, 2, 0]
+    """
+    perm = array('l', range(len(arr)))
+    rng = random.Random(seed)
+    
+    def partition(low, high):
+        """Three-way partition of perm[low..high] by value around a random pivot."""
+        pivot = arr[perm[rng.randint(low, high)]]
+        lt = low
+        i = low
+        gt = high
+        while i <= gt:
+            index = perm[i]
+            value = arr[index]
+            if value < pivot:
+                perm[lt], perm[i] = index, perm[lt]
+                lt += 1
+                i += 1
+            elif pivot < value:
+                perm[i], perm[gt] = perm[gt], index
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt
+    
+    def quick_sort_helper(low, high):
+        while low < high:
+            lt, gt = partition(low, high)
+            
+            # Recurse into the smaller side, loop on the larger side
+            if lt - low < high - gt:
+                quick_sort_helper(low, lt - 1)
+                low = gt + 1
+            else:
+                quick_sort_helper(gt + 1, high)
+                high = lt - 1
+    
+    quick_sort_helper(0, len(arr) - 1)
+    return perm
+
+
+def partition_three_way(arr, low, high, pivot_index):
+    """
+    Three-way (Dutch national flag) partition of arr[low..high] around arr[pivot_index].
+    
+    Unlike the Lomuto partition used by quick_sort, runs of elements equal to the
+    pivot end up grouped in the middle, so inputs with many duplicates do not
+    degrade to O(n²).
+    
+    Args:
+        arr (list): Array to be partitioned in place
+        low (int): Starting index
+        high (int): Ending index (inclusive)
+        pivot_index (int): Index of the pivot element, in [low, high]
+        
+    Returns:
+        tuple: (lt, gt) such that arr[low..lt-1] < pivot, arr[lt..gt] == pivot
+               and arr[gt+1..high] > pivot
+    """
+    pivot = arr[pivot_index]
+    lt = low
+    i = low
+    gt = high
+    
+    while i <= gt:
+        value = arr[i]
+        if value < pivot:
+            arr[lt], arr[i] = value, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            arr[i], arr[gt] = arr[gt], value
+            gt -= 1
+        else:
+            i += 1
+    
+    return lt, gt
+
+
+def quick_select(arr, k, seed=None):
+    """
+    Find the k-th smallest element (0-based) without sorting the whole array.
+    
+    Quickselect partitions like quicksort but only continues into the side that
+    contains position k. The three-way partition stops as soon as k lands in the
+    run of elements equal to the pivot, so heavy duplication is cheap.
+    
+    Args:
+        arr (list): List of comparable elements (not modified)
+        k (int): Rank of the wanted element, 0 <= k < len(arr)
+        seed: Optional seed for the random pivot choice
+    
+    Returns:
+        The element that would be at index k after sorting
+    
+    Examples:
+        >>> quick_select([64, 34, 25, 12, 22, 11, 90], 3)
+        25
+        
+        >>> quick_select([3, 1, 2], 0)
+        1
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError("quick_select index out of range")
+    
+    work = list(arr)
+    rng = random.Random(seed)
+    low, high = 0, n - 1
+    
+    while low < high:
+        lt, gt = partition_three_way(work, low, high, rng.randint(low, high))
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return work[k]  # k falls in the run equal to the pivot
+    
+    return work[k]
+
+
+def quick_sort_incremental(arr, seed=None):
+    """
+    Lazily yield the elements of arr in ascending order (incremental quicksort).
+    
+    Only the part of the array needed for the next element is partitioned. A stack
+    of pivot positions remembers the segments that are already separated from each
+    other, so each partition step is reused by every later element. Consuming the
+    first k elements costs expected O(n + k log k); iterating to the end is an
+    ordinary O(n log n) quicksort spread over the iteration.
+    
+    Args:
+        arr (list): Iterable of comparable elements (copied, not modified)
+        seed: Optional seed for the random pivot choice
+        
+    Yields:
+        Elements of arr in ascending order
+        
+    Examples:
+        >>> from itertools import islice
+        >>> list(islice(quick_sort_incremental([64, 34, 25, 12, 22, 11, 90]), 3))
+        [11, 12, 22]
+    """
+    arr_copy = list(arr)
+    n = len(arr_copy)
+    rng = random.Random(seed)
+    cutoff = 16
+    
+    # Each entry (end, done) bounds a segment starting at the next unread position:
+    # everything before `end` is <= everything from `end` onwards, and `done`
+    # marks a segment that is already in final order (a run equal to a pivot)
+    stack = [(n, False)]
+    idx = 0
+    
+    while idx < n:
+        end, done = stack[-1]
+        
+        if done or end - idx <= cutoff:
+            stack.pop()
+            if not done:
+                # Short segment: finish it with a plain insertion sort
+                for i in range(idx + 1, end):
+                    key = arr_copy[i]
+                    j = i - 1
+                    while j >= idx and key < arr_copy[j]:
+                        arr_copy[j + 1] = arr_copy[j]
+                        j -= 1
+                    arr_copy[j + 1] = key
+            while idx < end:
+                yield arr_copy[idx]
+                idx += 1
+            continue
+        
+        # Split the current segment and remember the new boundaries
+        lt, gt = partition_three_way(arr_copy, idx, end - 1, rng.randrange(idx, end))
+        stack.pop()
+        if gt + 1 < end:
+            stack.append((end, False))
+        stack.append((gt + 1, True))
+        if lt > idx:
+            stack.append((lt, False))
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     # Test cases
@@ -267,4 +476,35 @@ if __name__ == "__main__":
     # Verbose example for educational purposes
     print("\n=== Verbose Example ===")
     sample_array = [64, 34, 25, 12, 22, 11]
-    quick_sort_verbose(sample_array)
\ No newline at end of file
+    quick_sort_verbose(sample_array)
+    
+    # Argsort: the permutation that sorts the array
+    print("\n=== Quick Sort Argsort ===")
+    sample_array = [170, 45, 75, 90, 2, 45]
+    perm = quick_sort_argsort(sample_array)
+    print(f"Array:       {sample_array}")
+    print(f"Permutation: {list(perm)}")
+    print(f"Reordered:   {[sample_array[i] for i in perm]}")
+    
+    # Quickselect: one order statistic in expected O(n)
+    print("\n=== Quick Select ===")
+    sample_array = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Array: {sample_array}")
+    print(f"Median (k=3): {quick_select(sample_array, 3)} "
+          f"(sorted: {quick_sort(sample_array)})")
+    
+    # Lazy incremental sort: only the first page is fully ordered
+    print("\n=== Incremental Quick Sort (first page only) ===")
+    from itertools import islice
+    import time
+    
+    big_array = [random.random() for _ in range(1_000_000)]
+    start = time.perf_counter()
+    first_page = list(islice(quick_sort_incremental(big_array), 20))
+    lazy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    full_sort = quick_sort(big_array)
+    full_time = time.perf_counter() - start
+    print(f"First 20 of {len(big_array)} elements match full sort: {first_page == full_sort[:20]}")
+    print(f"  quick_sort_incremental (20 items): {lazy_time:.3f} seconds")
+    print(f"  quick_sort (all items):            {full_time:.3f} seconds")
\ No newline at end of file
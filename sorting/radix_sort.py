@@ -23,6 +23,9 @@ Space Complexity: O(n + k) where k is the range of each digit (10 for decimal)
 Stability: Stable - maintains relative order of equal elements
 """
 
+from array import array
+
+
 def radix_sort(arr):
     """
     Sorts an array of non-negative integers using radix sort.
@@ -241,6 +244,150 @@ def counting_sort_strings(strings, pos):
     return output
 
 
+def radix_sort_argsort(arr):
+    """
+    Stable LSD radix sort that returns the sorting permutation instead of moved values.
+    
+    Each digit pass is a stable counting sort of the index array keyed on that
+    digit of arr[index], exactly as in radix_sort.
+    
+    Args:
+        arr (list): List of non-negative integers (not modified)
+        
+    Returns:
+        array: array('l') perm where arr[perm[0]] <= arr[perm[1]] <= ...;
+               equal elements keep their original relative order
+        
+    Examples:
+        >>> list(radix_sort_argsort([170, 45, 75, 45]))
+        [1, 3, 2, 0]
+    """
+    n = len(arr)
+    perm = array('l', range(n))
+    if n <= 1:
+        return perm
+    
+    if any(x < 0 for x in arr):
+        raise ValueError("Radix sort only works with non-negative integers")
+    
+    output = array('l', perm)
+    max_num = max(arr)
+    exp = 1
+    
+    while max_num // exp > 0:
+        count = [0] * 10
+        for index in perm:
+            count[(arr[index] // exp) % 10] += 1
+        
+        for i in range(1, 10):
+            count[i] += count[i - 1]
+        
+        # Right to left keeps the pass stable
+        for i in range(n - 1, -1, -1):
+            index = perm[i]
+            digit = (arr[index] // exp) % 10
+            count[digit] -= 1
+            output[count[digit]] = index
+        
+        perm, output = output, perm
+        exp *= 10
+    
+    return perm
+
+
+def radix_sort_american_flag(arr, cutoff=32):
+    """
+    In-place MSD radix sort (American flag sort) for non-negative integers.
+    
+    Instead of copying every element into a fresh output array on each digit pass
+    like radix_sort, this variant works on one byte at a time from the most
+    significant end. A 256-entry histogram gives each bucket's slot range, and the
+    elements are then permuted into their buckets with cycle-leader swaps: every
+    element is picked up and dropped directly into the next free slot of its bucket.
+    Each bucket is sorted recursively on the next byte, and buckets of at most
+    `cutoff` elements are finished with insertion sort.
+    
+    The only extra memory is the histogram and bucket pointers of each active
+    level (3 × 256 counters), so peak memory stays at about 1× the input.
+    
+    Args:
+        arr (list): List (or array.array) of non-negative integers, sorted in place
+        cutoff (int): Bucket size at or below which insertion sort is used
+        
+    Returns:
+        list: arr itself, now sorted
+        
+    Examples:
+        >>> radix_sort_american_flag([170, 45, 75, 90, 2, 802, 24, 66])
+        [2, 24, 45, 66, 75, 90, 170, 802]
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+    
+    if any(x < 0 for x in arr):
+        raise ValueError("Radix sort only works with non-negative integers")
+    
+    def insertion_sort_range(lo, hi):
+        """Insertion sort of arr[lo:hi] in place."""
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    
+    # Start from the most significant byte of the largest value
+    top_shift = max(0, (max(arr).bit_length() - 1) // 8 * 8)
+    stack = [(0, n, top_shift)]
+    
+    while stack:
+        lo, hi, shift = stack.pop()
+        
+        if hi - lo <= cutoff:
+            insertion_sort_range(lo, hi)
+            continue
+        
+        # Histogram of the current byte
+        count = [0] * 256
+        for i in range(lo, hi):
+            count[(arr[i] >> shift) & 0xFF] += 1
+        
+        # heads[b] is the next unfilled slot of bucket b, tails[b] its end
+        heads = [0] * 256
+        tails = [0] * 256
+        position = lo
+        for b in range(256):
+            heads[b] = position
+            position += count[b]
+            tails[b] = position
+        
+        # Cycle-leader permutation: carry each misplaced element to its bucket
+        for b in range(256):
+            while heads[b] < tails[b]:
+                value = arr[heads[b]]
+                digit = (value >> shift) & 0xFF
+                while digit != b:
+                    slot = heads[digit]
+                    heads[digit] = slot + 1
+                    arr[slot], value = value, arr[slot]
+                    digit = (value >> shift) & 0xFF
+                arr[heads[b]] = value
+                heads[b] += 1
+        
+        # Recurse into every bucket on the next byte
+        if shift > 0:
+            start = lo
+            for b in range(256):
+                end = tails[b]
+                if end - start > 1:
+                    stack.append((start, end, shift - 8))
+                start = end
+    
+    return arr
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     import math
@@ -288,4 +435,32 @@ if __name__ == "__main__":
     # Verbose example for educational purposes
     print("\n=== Verbose Example ===")
     sample_array = [170, 45, 75, 90, 2, 802, 24, 66]
-    radix_sort_verbose(sample_array)
\ No newline at end of file
+    radix_sort_verbose(sample_array)
+    
+    # Argsort: the permutation that sorts the array
+    print("\n=== Radix Sort Argsort ===")
+    sample_array = [170, 45, 75, 90, 2, 45]
+    perm = radix_sort_argsort(sample_array)
+    print(f"Array:       {sample_array}")
+    print(f"Permutation: {list(perm)}")
+    print(f"Reordered:   {[sample_array[i] for i in perm]}")
+    
+    # In-place MSD radix sort
+    print("\n=== American Flag Sort (in-place MSD radix) ===")
+    sample_array = [170, 45, 75, 90, 2, 802, 24, 66]
+    print(f"Original: {sample_array}")
+    radix_sort_american_flag(sample_array)
+    print(f"Sorted:   {sample_array}")
+    
+    import random
+    import time
+    big_array = [random.getrandbits(48) for _ in range(200_000)]
+    start = time.perf_counter()
+    expected = radix_sort(big_array)
+    lsd_time = time.perf_counter() - start
+    start = time.perf_counter()
+    radix_sort_american_flag(big_array)
+    msd_time = time.perf_counter() - start
+    print(f"Results match: {big_array == expected}")
+    print(f"  radix_sort (LSD, copying):    {lsd_time:.3f} seconds")
+    print(f"  radix_sort_american_flag:     {msd_time:.3f} seconds")
\ No newline at end of file
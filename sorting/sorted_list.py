@@ -0,0 +1,569 @@
+"""
+Sorted List (Bucketed Binary Insertion) Implementation
+
+A SortedList keeps its elements in ascending order across a sequence of inserts and
+deletes. It applies the idea behind insertion_sort_binary_search (find the insertion
+point by bisection, then shift) to many short sublists ("buckets") instead of one long
+list, so each shift only moves the elements of a single bucket.
+
+Layout:
+- _lists holds the buckets, each a sorted Python list of roughly `load` elements
+- _maxes holds the largest element of every bucket, so the right bucket for a value
+  is found by bisecting _maxes before bisecting inside the bucket
+- _index is a Fenwick tree over the bucket sizes, so the number of elements before
+  a bucket (and the bucket holding a position) is found in O(log(n / load)) steps;
+  it is updated in place on add/delete and rebuilt lazily after a split or merge
+- Buckets are split when they grow past 2 × load and merged with a neighbour when
+  they shrink below load / 2
+
+Key characteristics:
+- Long-lived container for streaming inserts and deletes
+- Duplicates allowed; equal elements keep their insertion order
+- Bulk load from already-sorted data in O(n)
+
+Time Complexity (load L, 1000 by default):
+- add / remove / discard: O(log n) comparisons + O(L) data movement
+  (+ O(n / L) for the occasional index rebuild after a split or merge)
+- Positional index / index(value) / bisect: O(log n) comparisons + O(log(n / L))
+  index steps
+- Range query: O(log n + k) for k reported elements
+- Bulk load from sorted data: O(n)
+
+Space Complexity: O(n) - plus O(n / L) for the bucket maxima and size index
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedList:
+    """
+    A list that stays sorted under insertions and deletions.
+
+    Examples:
+        >>> sl = SortedList([5, 1, 4])
+        >>> sl.add(3)
+        >>> list(sl)
+        [1, 3, 4, 5]
+
+        >>> sl[1], sl.index(4), 5 in sl
+        (3, 2, True)
+
+        >>> list(sl.irange(2, 4))
+        [3, 4]
+    """
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, iterable=None, load=DEFAULT_LOAD):
+        """
+        Args:
+            iterable: Optional initial elements (any order)
+            load (int): Target bucket size; buckets hold between load/2 and 2*load elements
+        """
+        if load < 4:
+            raise ValueError("load must be at least 4")
+
+        self._load = load
+        self._lists = []
+        self._maxes = []
+        self._index = None  # Fenwick tree over bucket sizes, None when stale
+        self._top = 0
+        self._len = 0
+
+        if iterable is not None:
+            self._bulk_load(sorted(iterable))
+
+    @classmethod
+    def from_sorted(cls, sorted_values, load=DEFAULT_LOAD):
+        """
+        Build a SortedList from data that is already in ascending order.
+
+        Args:
+            sorted_values: Iterable of elements in ascending order
+            load (int): Target bucket size
+
+        Returns:
+            SortedList: New container holding the elements
+
+        Raises:
+            ValueError: If the input is not in ascending order
+        """
+        values = list(sorted_values)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError(f"Input is not sorted at index {i}")
+
+        sorted_list = cls(load=load)
+        sorted_list._bulk_load(values)
+        return sorted_list
+
+    def _bulk_load(self, values):
+        """Replace the contents with the already-sorted list `values`."""
+        load = self._load
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [bucket[-1] for bucket in self._lists]
+        self._index = None
+        self._len = len(values)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for bucket in self._lists:
+            yield from bucket
+
+    def __reversed__(self):
+        for bucket in reversed(self._lists):
+            yield from reversed(bucket)
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        idx = bisect_left(bucket, value)
+        return bucket[idx] == value
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    def clear(self):
+        """Remove all elements."""
+        self._lists = []
+        self._maxes = []
+        self._index = None
+        self._len = 0
+
+    def add(self, value):
+        """
+        Insert value, keeping the list sorted.
+
+        Args:
+            value: Element to insert (placed after any equal elements)
+        """
+        lists = self._lists
+        maxes = self._maxes
+
+        if not maxes:
+            lists.append([value])
+            maxes.append(value)
+            self._index = None
+            self._len = 1
+            return
+
+        # Find the first bucket whose maximum is greater than value
+        pos = bisect_right(maxes, value)
+
+        if pos == len(maxes):
+            # Larger than (or equal to) everything: append to the last bucket
+            pos -= 1
+            lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            insort(lists[pos], value)
+
+        self._len += 1
+        self._update_index(pos, 1)
+        self._split(pos)
+
+    def update(self, iterable):
+        """
+        Insert every element of iterable.
+
+        Large batches are merged with the existing contents and bulk loaded,
+        which is cheaper than adding them one at a time.
+
+        Args:
+            iterable: Elements to insert
+        """
+        values = sorted(iterable)
+        if len(values) * 4 >= self._len:
+            # Timsort detects the two sorted runs and merges them in O(n)
+            merged = list(self)
+            merged.extend(values)
+            merged.sort()
+            self._bulk_load(merged)
+        else:
+            for value in values:
+                self.add(value)
+
+    def _split(self, pos):
+        """Split bucket pos in half if it has grown past twice the load."""
+        bucket = self._lists[pos]
+        if len(bucket) <= 2 * self._load:
+            return
+
+        half = bucket[self._load:]
+        del bucket[self._load:]
+        self._lists.insert(pos + 1, half)
+        self._maxes[pos] = bucket[-1]
+        self._maxes.insert(pos + 1, half[-1])
+        self._index = None
+
+    def discard(self, value):
+        """
+        Remove one occurrence of value if present.
+
+        Args:
+            value: Element to remove
+
+        Returns:
+            bool: True if an element was removed, False otherwise
+        """
+        maxes = self._maxes
+        pos = bisect_left(maxes, value)
+        if pos == len(maxes):
+            return False
+
+        bucket = self._lists[pos]
+        idx = bisect_left(bucket, value)
+        if bucket[idx] != value:
+            return False
+
+        self._delete(pos, idx)
+        return True
+
+    def remove(self, value):
+        """
+        Remove one occurrence of value.
+
+        Args:
+            value: Element to remove
+
+        Raises:
+            ValueError: If value is not present
+        """
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def pop(self, index=-1):
+        """
+        Remove and return the element at a position.
+
+        Args:
+            index (int): Position to remove (defaults to the last element)
+
+        Returns:
+            The removed element
+        """
+        if not self._len:
+            raise IndexError("pop from empty SortedList")
+        pos, idx = self._locate(index)
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def _delete(self, pos, idx):
+        """Delete bucket[pos][idx] and rebalance the bucket if it became too small."""
+        lists = self._lists
+        maxes = self._maxes
+        bucket = lists[pos]
+
+        del bucket[idx]
+        self._len -= 1
+        self._update_index(pos, -1)
+
+        if not bucket:
+            del lists[pos]
+            del maxes[pos]
+            self._index = None
+            return
+
+        maxes[pos] = bucket[-1]
+
+        if len(bucket) < self._load // 2 and len(lists) > 1:
+            # Merge with the next bucket (or the previous one for the last bucket)
+            if pos == len(lists) - 1:
+                pos -= 1
+            lists[pos].extend(lists[pos + 1])
+            maxes[pos] = maxes[pos + 1]
+            del lists[pos + 1]
+            del maxes[pos + 1]
+            self._index = None
+            self._split(pos)
+
+    def _build_index(self):
+        """Rebuild the Fenwick tree over the bucket sizes in O(n / load)."""
+        count = len(self._lists)
+        tree = [0]  # 1-based; slot 0 unused
+        tree.extend(len(bucket) for bucket in self._lists)
+        for i in range(1, count + 1):
+            parent = i + (i & -i)
+            if parent <= count:
+                tree[parent] += tree[i]
+        self._index = tree
+        self._top = 1 << (count.bit_length() - 1) if count else 0
+
+    def _update_index(self, pos, delta):
+        """Record that bucket pos changed size by delta (no-op while the index is stale)."""
+        tree = self._index
+        if tree is None:
+            return
+        count = len(tree) - 1
+        i = pos + 1
+        while i <= count:
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index):
+        """
+        Convert a positional index into (bucket, offset) coordinates.
+
+        Descends the bucket-size index by binary lifting, as in
+        FenwickHistogram.select.
+
+        Args:
+            index (int): Position, negative values count from the end
+
+        Returns:
+            tuple: (bucket index, index within the bucket)
+        """
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= self._len:
+            raise IndexError("SortedList index out of range")
+
+        if self._index is None:
+            self._build_index()
+        tree = self._index
+        count = len(tree) - 1
+        pos = 0
+        step = self._top
+        while step:
+            following = pos + step
+            if following <= count and tree[following] <= index:
+                pos = following
+                index -= tree[following]
+            step >>= 1
+        return pos, index
+
+    def _offset(self, pos):
+        """Number of elements stored in the buckets before bucket pos."""
+        if self._index is None:
+            self._build_index()
+        tree = self._index
+        total = 0
+        while pos > 0:
+            total += tree[pos]
+            pos &= pos - 1
+        return total
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self.islice(start, stop))
+            return list(self)[index]
+
+        pos, idx = self._locate(index)
+        return self._lists[pos][idx]
+
+    def __delitem__(self, index):
+        pos, idx = self._locate(index)
+        self._delete(pos, idx)
+
+    def islice(self, start=0, stop=None):
+        """
+        Iterate over the elements at positions [start, stop).
+
+        Args:
+            start (int): First position (inclusive)
+            stop (int): Last position (exclusive), defaults to the end
+
+        Yields:
+            Elements in ascending order
+        """
+        if stop is None or stop > self._len:
+            stop = self._len
+        if start >= stop:
+            return
+
+        pos, idx = self._locate(start)
+        remaining = stop - start
+        lists = self._lists
+
+        while remaining > 0:
+            bucket = lists[pos]
+            chunk = bucket[idx:idx + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            pos += 1
+            idx = 0
+
+    def bisect_left(self, value):
+        """
+        Position of the first element >= value (insertion point before equal elements).
+
+        Args:
+            value: Value to locate
+
+        Returns:
+            int: Index in [0, len(self)]
+        """
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        """
+        Position of the first element > value (insertion point after equal elements).
+
+        Args:
+            value: Value to locate
+
+        Returns:
+            int: Index in [0, len(self)]
+        """
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_right(self._lists[pos], value)
+
+    def index(self, value):
+        """
+        Position of the first occurrence of value.
+
+        Args:
+            value: Element to look for
+
+        Returns:
+            int: Index of the leftmost occurrence
+
+        Raises:
+            ValueError: If value is not present
+        """
+        pos = bisect_left(self._maxes, value)
+        if pos < len(self._maxes):
+            bucket = self._lists[pos]
+            idx = bisect_left(bucket, value)
+            if bucket[idx] == value:
+                return self._offset(pos) + idx
+        raise ValueError(f"{value!r} not in SortedList")
+
+    def count(self, value):
+        """
+        Number of occurrences of value.
+
+        Args:
+            value: Element to count
+
+        Returns:
+            int: Occurrence count
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Iterate over the elements between minimum and maximum.
+
+        Args:
+            minimum: Lower bound (None for unbounded)
+            maximum: Upper bound (None for unbounded)
+            inclusive (tuple): Whether each bound is included
+
+        Yields:
+            Elements in the range, in ascending order
+        """
+        lists = self._lists
+        maxes = self._maxes
+        if not maxes:
+            return
+
+        if minimum is None:
+            pos, idx = 0, 0
+        elif inclusive[0]:
+            pos = bisect_left(maxes, minimum)
+            if pos == len(maxes):
+                return
+            idx = bisect_left(lists[pos], minimum)
+        else:
+            pos = bisect_right(maxes, minimum)
+            if pos == len(maxes):
+                return
+            idx = bisect_right(lists[pos], minimum)
+
+        while pos < len(lists):
+            bucket = lists[pos]
+            if maximum is None:
+                end = len(bucket)
+            elif inclusive[1]:
+                end = bisect_right(bucket, maximum, idx)
+            else:
+                end = bisect_left(bucket, maximum, idx)
+
+            yield from bucket[idx:end]
+
+            if end < len(bucket):
+                return
+            pos += 1
+            idx = 0
+
+
+# Example usage and test cases
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=== SortedList Basic Operations ===\n")
+
+    sl = SortedList([64, 34, 25, 12, 22, 11, 90])
+    print(f"Initial:          {list(sl)}")
+
+    sl.add(30)
+    sl.add(12)
+    print(f"After add 30, 12: {list(sl)}")
+
+    sl.remove(64)
+    print(f"After remove 64:  {list(sl)}")
+
+    print(f"sl[0], sl[-1]:    {sl[0]}, {sl[-1]}")
+    print(f"index(25):        {sl.index(25)}")
+    print(f"count(12):        {sl.count(12)}")
+    print(f"bisect_left(26):  {sl.bisect_left(26)}")
+    print(f"irange(12, 30):   {list(sl.irange(12, 30))}")
+    print(f"sl[2:5]:          {sl[2:5]}")
+
+    # Bulk load from already-sorted data
+    print("\n=== Bulk Load From Sorted Data ===")
+    sorted_data = list(range(0, 20, 2))
+    sl = SortedList.from_sorted(sorted_data, load=4)
+    print(f"Buckets (load=4): {sl._lists}")
+    sl.add(7)
+    print(f"After add 7:      {sl._lists}")
+
+    # Randomised check against a plain sorted list
+    print("\n=== Randomised Consistency Check ===")
+    rng = random.Random(42)
+    reference = []
+    sl = SortedList(load=8)
+    for _ in range(2000):
+        value = rng.randint(0, 200)
+        if reference and rng.random() < 0.4:
+            sl.remove(reference.pop(rng.randrange(len(reference))))
+        else:
+            reference.append(value)
+            sl.add(value)
+    reference.sort()
+    status = '✓ PASS' if list(sl) == reference else '✗ FAIL'
+    print(f"{len(reference)} elements after mixed inserts/deletes: {status}")
+
+    # Streaming inserts: SortedList vs re-running binary insertion on a plain list
+    print("\n=== Streaming Insert Benchmark ===")
+    n = 200_000
+    values = [rng.random() for _ in range(n)]
+
+    start = time.perf_counter()
+    sl = SortedList()
+    for value in values:
+        sl.add(value)
+    sorted_list_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plain = []
+    for value in values:
+        insort(plain, value)
+    plain_time = time.perf_counter() - start
+
+    print(f"  SortedList.add x {n}: {sorted_list_time:.3f} seconds")
+    print(f"  list insort x {n}:    {plain_time:.3f} seconds")